@@ -9,10 +9,10 @@ Contract v1 (Step0 fixed):
 from app.core.debug_tools import trace, trace_enabled, brief
 
 import asyncio
-import json
 from datetime import datetime
 from typing import Optional
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from app.core.config import settings
@@ -27,6 +27,8 @@ from app.schemas.ws_messages import (
     PongMessage,
     ResultItem,
     ResultMessage,
+    TYPE_PING,
+    dump_server_message,
     parse_client_message,
 )
 from app.utils.ids import generate_session_id
@@ -54,6 +56,14 @@ def _guess_session_seq(data: Optional[dict]) -> tuple[str, int]:
     return sid, seq
 
 
+async def _wait_until_ready(websocket: WebSocket) -> None:
+    """서버 워밍업(모델/데이터 로딩) 완료까지 대기 (초과 시 asyncio.TimeoutError)"""
+    warmup = getattr(websocket.app.state, "warmup", None)
+    if warmup is not None and not warmup.done():
+        logger.info("WS waiting for warm-up")
+        await asyncio.wait_for(asyncio.shield(warmup), timeout=settings.ws_timeout_seconds)
+
+
 def _map_error_code_to_front(code: ErrorCode) -> str:
     mapping = {
         ErrorCode.NO_FACE_DETECTED: "FACE_NOT_FOUND",
@@ -96,17 +106,17 @@ async def websocket_analyze(websocket: WebSocket):
             pass
 
         try:
-            data = json.loads(raw)
+            data = orjson.loads(raw)
             try:
                 logger.info("WS parsed json", data={"keys": list(data.keys()) if isinstance(data, dict) else None})
             except Exception:
                 pass
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             sid, seq = _guess_session_seq(None)
-            await websocket.send_json(ErrorResponse(
+            await websocket.send_text(dump_server_message(ErrorResponse(
                 session_id=sid, seq=seq, latency_ms=0,
                 error_code="DECODE_FAIL", message="invalid json", details=None
-            ).model_dump())
+            )))
             await websocket.close()
             return
 
@@ -123,20 +133,23 @@ async def websocket_analyze(websocket: WebSocket):
             except Exception:
                 pass
         except Exception:
-            await websocket.send_json(ErrorResponse(
+            await websocket.send_text(dump_server_message(ErrorResponse(
                 session_id=sid, seq=seq, latency_ms=0,
                 error_code="DECODE_FAIL", message="invalid message schema", details=None
-            ).model_dump())
+            )))
             await websocket.close()
             return
 
-        if getattr(msg, "type", None) == "ping":
-            await websocket.send_json(PongMessage().model_dump(mode="json"))
+        if getattr(msg, "type", None) == TYPE_PING:
+            await websocket.send_text(dump_server_message(PongMessage()))
             await websocket.close()
             return
 
         assert isinstance(msg, AnalyzeRequest)
 
+        # 백그라운드 워밍업이 끝나지 않았으면 대기
+        await _wait_until_ready(websocket)
+
         # Step0: progress_callback=None (progress 메시지 금지)
         logger.info("WS starting analysis", data={"session_id": msg.session_id, "seq": msg.seq, "image_b64": brief(msg.image_b64)})
         result = await run_analysis(
@@ -174,16 +187,16 @@ async def websocket_analyze(websocket: WebSocket):
             results=items,
         )
 
-        await websocket.send_json(resp.model_dump())
+        await websocket.send_text(dump_server_message(resp))
         await websocket.close()
         log.info("WS analyze done", latency_ms=int(result.analysis_time_ms))
 
     except asyncio.TimeoutError:
         sid, seq = _guess_session_seq(data)
-        await websocket.send_json(ErrorResponse(
+        await websocket.send_text(dump_server_message(ErrorResponse(
             session_id=sid, seq=seq, latency_ms=0,
             error_code="TIMEOUT", message="ws timeout", details=None
-        ).model_dump())
+        )))
         await websocket.close()
 
     except WebSocketDisconnect:
@@ -191,22 +204,22 @@ async def websocket_analyze(websocket: WebSocket):
 
     except BeautyInsideError as e:
         sid, seq = _guess_session_seq(data)
-        await websocket.send_json(ErrorResponse(
+        await websocket.send_text(dump_server_message(ErrorResponse(
             session_id=sid, seq=seq, latency_ms=0,
             error_code=_map_error_code_to_front(e.code),
             message="analysis error",
             details=None
-        ).model_dump())
+        )))
         await websocket.close()
         log.warning(f"Analysis error: {e.code} - {e.message}")
 
     except Exception as e:
         sid, seq = _guess_session_seq(data)
         try:
-            await websocket.send_json(ErrorResponse(
+            await websocket.send_text(dump_server_message(ErrorResponse(
                 session_id=sid, seq=seq, latency_ms=0,
                 error_code="DECODE_FAIL", message="server error", details=None
-            ).model_dump())
+            )))
             await websocket.close()
         except Exception:
             pass
@@ -82,6 +82,12 @@ class Settings(BaseSettings):
         if not self.cors_methods or self.cors_methods == "*":
             return ["*"]
         return [method.strip() for method in self.cors_methods.split(",")]
+
+    @property
+    def cors_allow_headers_list(self) -> list[str]:
+        if not self.cors_allow_headers or self.cors_allow_headers == "*":
+            return ["*"]
+        return [header.strip() for header in self.cors_allow_headers.split(",")]
     
     # 로깅 설정
     log_level: str = "INFO"
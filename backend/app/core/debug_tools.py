@@ -1,6 +1,7 @@
 """
 디버깅/트레이싱 유틸리티
 - 환경변수 BI_TRACE=1 또는 settings.debug=True 일 때, 함수 입/출력/예외를 구조화 로그로 남김
+- 트레이스 여부는 데코레이션(임포트) 시점에 결정 → 비활성 시 래퍼 없이 원본 함수 그대로 사용
 - 과도한 로그를 피하기 위해 값 요약(brief)만 기록
 """
 from __future__ import annotations
@@ -107,16 +108,17 @@ def trace(name: Optional[str] = None) -> Callable:
     함수 트레이스 데코레이터 (sync/async 지원).
     - entry/exit + 실행시간
     - 예외 발생 시 stacktrace 포함
+    - 비활성 시 원본 함수를 그대로 반환 (호출 오버헤드 없음)
     """
     def decorator(func: Callable) -> Callable:
+        if not trace_enabled():
+            return func
+
         op = name or getattr(func, "__qualname__", getattr(func, "__name__", "op"))
 
         if inspect.iscoroutinefunction(func):
             @wraps(func)
             async def aw(*args: Any, **kwargs: Any) -> Any:
-                if not trace_enabled():
-                    return await func(*args, **kwargs)
-
                 t0 = time.perf_counter()
                 _logger.info(f"[TRACE] enter {op}", data={"args": _args_summary(func, args, kwargs)})
                 try:
@@ -133,9 +135,6 @@ def trace(name: Optional[str] = None) -> Callable:
 
         @wraps(func)
         def sw(*args: Any, **kwargs: Any) -> Any:
-            if not trace_enabled():
-                return func(*args, **kwargs)
-
             t0 = time.perf_counter()
             _logger.info(f"[TRACE] enter {op}", data={"args": _args_summary(func, args, kwargs)})
             try:
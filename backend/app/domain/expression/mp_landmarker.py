@@ -4,6 +4,7 @@ MediaPipe 초기화/추론 래퍼 모듈
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import threading
 from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
@@ -24,6 +25,7 @@ if trace_enabled():
 # MediaPipe Face Landmarker 지연 로딩
 _landmarker = None
 _landmarker_initialized = False
+_landmarker_lock = threading.Lock()
 
 
 @trace("mediapipe._get_landmarker")
@@ -34,37 +36,42 @@ def _get_landmarker():
     if _landmarker_initialized:
         return _landmarker
     
-    try:
-        import mediapipe as mp
-        from mediapipe.tasks import python
-        from mediapipe.tasks.python import vision
+    with _landmarker_lock:
+        # 다른 스레드가 먼저 초기화했으면 재사용 (double-checked locking)
+        if _landmarker_initialized:
+            return _landmarker
+    
+        try:
+            import mediapipe as mp
+            from mediapipe.tasks import python
+            from mediapipe.tasks.python import vision
         
-        # 모델 파일 경로 (자동 다운로드)
-        model_path = get_mediapipe_model_path()
-        logger.info(f"Loading MediaPipe model from: {model_path}")
+            # 모델 파일 경로 (자동 다운로드)
+            model_path = get_mediapipe_model_path()
+            logger.info(f"Loading MediaPipe model from: {model_path}")
         
-        base_options = python.BaseOptions(
-            model_asset_path=model_path
-        )
+            base_options = python.BaseOptions(
+                model_asset_path=model_path
+            )
         
-        options = vision.FaceLandmarkerOptions(
-            base_options=base_options,
-            output_face_blendshapes=True,
-            output_facial_transformation_matrixes=True,
-            num_faces=settings.max_faces + 1,  # 여러 얼굴 감지용
-            min_face_detection_confidence=settings.face_detection_confidence,
-            min_face_presence_confidence=0.5,
-            min_tracking_confidence=0.5,
-        )
+            options = vision.FaceLandmarkerOptions(
+                base_options=base_options,
+                output_face_blendshapes=True,
+                output_facial_transformation_matrixes=True,
+                num_faces=settings.max_faces + 1,  # 여러 얼굴 감지용
+                min_face_detection_confidence=settings.face_detection_confidence,
+                min_face_presence_confidence=0.5,
+                min_tracking_confidence=0.5,
+            )
         
-        _landmarker = vision.FaceLandmarker.create_from_options(options)
-        _landmarker_initialized = True
-        logger.info("MediaPipe FaceLandmarker initialized")
+            _landmarker = vision.FaceLandmarker.create_from_options(options)
+            _landmarker_initialized = True
+            logger.info("MediaPipe FaceLandmarker initialized")
         
-    except Exception as e:
-        logger.warning(f"MediaPipe FaceLandmarker initialization failed: {e}")
-        _landmarker_initialized = True
-        _landmarker = None
+        except Exception as e:
+            logger.warning(f"MediaPipe FaceLandmarker initialization failed: {e}")
+            _landmarker_initialized = True
+            _landmarker = None
     
     return _landmarker
 
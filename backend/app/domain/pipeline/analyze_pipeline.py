@@ -77,7 +77,8 @@ class AnalyzePipeline:
         self.embedder = get_embedder()
         self.cropper = FaceCropper()
         self.quality_gate = QualityGate(strict=self.config.strict_quality)
-        self.similarity_calc = SimilarityCalculator()
+        # 연예인 임베딩은 로더에서 L2 정규화됨
+        self.similarity_calc = SimilarityCalculator(assume_normalized=True)
         
         # 데이터 로더
         self._celeb_loader = None
@@ -224,7 +224,24 @@ class ScoreScaler:
         Returns:
             점수 리스트
         """
-        return [self.scale(sim) for sim in similarities]
+        # 백분위는 구간 탐색이라 스칼라 경로 유지
+        if self.method == "percentile":
+            return [self.scale(sim) for sim in similarities]
+        
+        # 나머지는 ufunc 한 번으로 일괄 계산 (알 수 없는 방법은 linear)
+        values = np.clip(np.asarray(similarities, dtype=np.float64), 0.0, 1.0)
+        if self.method == "sigmoid":
+            center = self.kwargs.get("center", 0.5)
+            steepness = self.kwargs.get("steepness", 10)
+            values = 1.0 / (1.0 + np.exp(-steepness * (values - center)))
+        elif self.method == "power":
+            values = np.power(values, self.kwargs.get("power", 0.5))
+        
+        scaled = self.min_score + values * (self.max_score - self.min_score)
+        # 반올림은 스칼라 경로와 동일하게 원소별로 (np.round는 52.45 → 52.4처럼 round()와 다름)
+        # 스칼라 sigmoid는 np.float64에 round()를 적용하므로 같은 타입 유지
+        items = scaled if self.method == "sigmoid" else scaled.tolist()
+        return [float(round(v, 1)) for v in items]
 
 
 # 기본 스케일러 인스턴스
@@ -1,13 +1,23 @@
 """
 유사도 계산 모듈
-cosine/거리 계산 (NumPy/SciPy)
+cosine/거리 계산 (NumPy, SimSIMD/Numba 설치 시 가속)
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+from operator import itemgetter
 from typing import List, Tuple, Optional
 
 import numpy as np
-from scipy.spatial.distance import cosine, euclidean
+
+try:
+    import simsimd
+except ImportError:  # 선택적 의존성 - 없으면 Numba/NumPy 경로 사용
+    simsimd = None
+
+try:
+    from numba import njit
+except ImportError:  # 선택적 의존성 - 없으면 NumPy 경로 사용
+    njit = None
 
 from app.core.logger import get_logger
 from app.utils.timeit import timeit
@@ -19,6 +29,55 @@ logger = get_logger(__name__)
 if trace_enabled():
     logger.info("[TRACE] module loaded", data={"module": __name__})
 
+
+# 노름이 0인 벡터 (예: 빈 임베딩)로 나눌 때 NaN 방지
+_NORM_EPS = 1e-12
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True, boundscheck=False)
+    def _dot(a, b):
+        # 누산기 4개로 분리 → 루프 의존성 제거 (FMA 벡터화)
+        s0 = s1 = s2 = s3 = 0.0
+        n = a.shape[0]
+        i = 0
+        while i + 4 <= n:
+            s0 += a[i] * b[i]
+            s1 += a[i + 1] * b[i + 1]
+            s2 += a[i + 2] * b[i + 2]
+            s3 += a[i + 3] * b[i + 3]
+            i += 4
+        while i < n:
+            s0 += a[i] * b[i]
+            i += 1
+        return s0 + s1 + s2 + s3
+
+    @njit(fastmath=True, cache=True, boundscheck=False)
+    def _sq_dist(a, b):
+        s = 0.0
+        for i in range(a.shape[0]):
+            d = a[i] - b[i]
+            s += d * d
+        return s
+
+    # import 시 미리 컴파일 (첫 요청의 JIT 지연 방지)
+    _warmup_vec = np.ones(512, dtype=np.float64)
+    _dot(_warmup_vec, _warmup_vec)
+    _sq_dist(_warmup_vec, _warmup_vec)
+else:
+    def _dot(a: np.ndarray, b: np.ndarray) -> float:
+        return float(np.dot(a, b))
+
+    def _sq_dist(a: np.ndarray, b: np.ndarray) -> float:
+        d = a - b
+        return float(np.dot(d, d))
+
+
+def _as_vector(vec: np.ndarray) -> np.ndarray:
+    """1D float64 연속 배열로 변환 (이미 해당 형식이면 복사 없음)"""
+    return np.ascontiguousarray(vec, dtype=np.float64).ravel()
+
+
 def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     """
     코사인 유사도 계산
@@ -30,8 +89,12 @@ def cosine_similarity(vec1: np.ndarray, vec2: np.ndarray) -> float:
     Returns:
         유사도 (0~1, 1이 가장 유사)
     """
-    # scipy.cosine은 거리를 반환하므로 1에서 빼기
-    return 1 - cosine(vec1, vec2)
+    a = _as_vector(vec1)
+    b = _as_vector(vec2)
+    if simsimd is not None:
+        # simsimd.cosine은 거리를 반환하므로 1에서 빼기
+        return 1.0 - float(simsimd.cosine(a, b))
+    return float(_dot(a, b) / max(np.sqrt(_dot(a, a) * _dot(b, b)), _NORM_EPS))
 
 
 def euclidean_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
@@ -45,12 +108,17 @@ def euclidean_distance(vec1: np.ndarray, vec2: np.ndarray) -> float:
     Returns:
         거리 (낮을수록 유사)
     """
-    return euclidean(vec1, vec2)
+    a = _as_vector(vec1)
+    b = _as_vector(vec2)
+    if simsimd is not None:
+        return float(np.sqrt(simsimd.sqeuclidean(a, b)))
+    return float(np.sqrt(_sq_dist(a, b)))
 
 
 def batch_cosine_similarity(
     query: np.ndarray,
-    candidates: np.ndarray
+    candidates: np.ndarray,
+    assume_normalized: bool = False
 ) -> np.ndarray:
     """
     배치 코사인 유사도 계산 (벡터화)
@@ -58,14 +126,28 @@ def batch_cosine_similarity(
     Args:
         query: 쿼리 벡터 (1D 또는 2D)
         candidates: 후보 벡터들 (2D: n_candidates x dim)
+        assume_normalized: 후보 행이 이미 L2 정규화되어 있으면 True (단일 GEMV)
     
     Returns:
         유사도 배열 (n_candidates,)
     """
+    if assume_normalized:
+        # 후보는 로드 시 정규화됨 → 쿼리만 정규화 후 행렬-벡터 곱 한 번
+        q = query.ravel()
+        q = (q / max(np.linalg.norm(q), _NORM_EPS)).astype(candidates.dtype, copy=False)
+        return candidates @ q
+    
     # 쿼리가 1D면 2D로 변환
     if query.ndim == 1:
         query = query.reshape(1, -1)
     
+    if simsimd is not None and candidates.dtype in (np.float32, np.float64):
+        # SIMD 커널로 (1, N) 코사인 거리 한 번에 계산
+        distances = simsimd.cdist(
+            query.astype(candidates.dtype, copy=False), candidates, metric="cosine"
+        )
+        return 1.0 - np.asarray(distances).flatten()
+    
     # L2 정규화
     query_norm = query / np.linalg.norm(query, axis=1, keepdims=True)
     candidates_norm = candidates / np.linalg.norm(candidates, axis=1, keepdims=True)
@@ -100,13 +182,37 @@ def batch_euclidean_distance(
     return distances
 
 
+def top_k_indices(similarities: np.ndarray, k: int) -> np.ndarray:
+    """
+    유사도 상위 k개 인덱스 (내림차순) - 전체 정렬 대신 argpartition 사용
+    
+    Args:
+        similarities: 유사도 배열
+        k: 반환할 개수
+    
+    Returns:
+        상위 k개 인덱스 배열
+    """
+    n = len(similarities)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < n:
+        idx = np.argpartition(similarities, -k)[-k:]
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-similarities[idx], kind="stable")]
+
+
 @trace("compute_similarities")
 @timeit("compute_similarities")
 def compute_similarities(
     user_embedding: np.ndarray,
     celeb_embeddings: np.ndarray,
     celeb_ids: np.ndarray,
-    method: str = "cosine"
+    method: str = "cosine",
+    assume_normalized: bool = False,
+    k: Optional[int] = None
 ) -> List[Tuple[str, float]]:
     """
     사용자 임베딩과 연예인 임베딩 간 유사도 계산
@@ -116,6 +222,8 @@ def compute_similarities(
         celeb_embeddings: 연예인 임베딩 배열
         celeb_ids: 연예인 ID 배열
         method: 유사도 계산 방법 (cosine, euclidean)
+        assume_normalized: 연예인 임베딩이 L2 정규화되어 있으면 True
+        k: 지정 시 상위 k개만 반환 (전체 정렬 생략)
     
     Returns:
         (celeb_id, similarity) 튜플 리스트 (유사도 내림차순 정렬)
@@ -135,7 +243,9 @@ def compute_similarities(
         raise ValueError(f"Embedding dim mismatch: user={user_embedding.shape} cand={celeb_embeddings.shape}")
 
     if method == "cosine":
-        similarities = batch_cosine_similarity(user_embedding, celeb_embeddings)
+        similarities = batch_cosine_similarity(
+            user_embedding, celeb_embeddings, assume_normalized=assume_normalized
+        )
     elif method == "euclidean":
         # 거리를 유사도로 변환 (작을수록 유사 → 클수록 유사)
         distances = batch_euclidean_distance(user_embedding, celeb_embeddings)
@@ -145,16 +255,22 @@ def compute_similarities(
     else:
         raise ValueError(f"Unknown similarity method: {method}")
     
-    # (id, similarity) 튜플 생성 및 정렬
-    results = [
+    # 유사도 내림차순 인덱스 (k 지정 시 부분 정렬)
+    if k is None:
+        order = np.argsort(-similarities, kind="stable")
+    else:
+        order = top_k_indices(similarities, k)
+    
+    # (id, similarity) 튜플 생성
+    return [
         (str(celeb_ids[i]), float(similarities[i]))
-        for i in range(len(celeb_ids))
+        for i in order.tolist()
     ]
-    
-    # 유사도 내림차순 정렬
-    results.sort(key=lambda x: x[1], reverse=True)
-    
-    return results
+
+
+# filter_by_threshold 벡터화 기준 (이하 항목 수는 컴프리헨션 사용)
+_FILTER_VECTORIZE_MIN = 64
+_SCORE_OF = itemgetter(1)
 
 
 def filter_by_threshold(
@@ -171,24 +287,33 @@ def filter_by_threshold(
     Returns:
         필터링된 결과 리스트
     """
-    return [(id, sim) for id, sim in results if sim >= threshold]
+    # 소량은 컴프리헨션이 NumPy 변환 비용보다 빠름
+    if len(results) <= _FILTER_VECTORIZE_MIN:
+        return [(id, sim) for id, sim in results if sim >= threshold]
+    
+    scores = np.fromiter(map(_SCORE_OF, results), dtype=np.float64, count=len(results))
+    keep = np.flatnonzero(scores >= threshold).tolist()
+    return [results[i] for i in keep]
 
 
 class SimilarityCalculator:
     """유사도 계산기 클래스"""
     
-    def __init__(self, method: str = "cosine"):
+    def __init__(self, method: str = "cosine", assume_normalized: bool = False):
         """
         Args:
             method: 유사도 계산 방법 (cosine, euclidean)
+            assume_normalized: 후보 임베딩이 L2 정규화되어 있으면 True
         """
         self.method = method
+        self.assume_normalized = assume_normalized
     
     def calculate(
         self,
         query: np.ndarray,
         candidates: np.ndarray,
-        candidate_ids: np.ndarray
+        candidate_ids: np.ndarray,
+        k: Optional[int] = None
     ) -> List[Tuple[str, float]]:
         """
         유사도 계산
@@ -197,12 +322,14 @@ class SimilarityCalculator:
             query: 쿼리 임베딩
             candidates: 후보 임베딩들
             candidate_ids: 후보 ID들
+            k: 지정 시 상위 k개만 반환
         
         Returns:
             정렬된 (id, similarity) 리스트
         """
         return compute_similarities(
-            query, candidates, candidate_ids, self.method
+            query, candidates, candidate_ids, self.method,
+            assume_normalized=self.assume_normalized, k=k
         )
     
     def get_top_k(
@@ -226,9 +353,10 @@ class SimilarityCalculator:
         Returns:
             Top-K (id, similarity) 리스트
         """
-        results = self.calculate(query, candidates, candidate_ids)
+        # 내림차순이므로 상위 k개 선택 후 임계값 필터링해도 결과 동일
+        results = self.calculate(query, candidates, candidate_ids, k=k)
         
         if threshold is not None:
             results = filter_by_threshold(results, threshold)
         
-        return results[:k]
+        return results
@@ -149,29 +149,34 @@ def apply_diversity(
     Returns:
         다양성이 적용된 결과 리스트
     """
-    celeb_counts = {}
-    adjusted = []
+    if not similarities:
+        return []
     
-    for celeb_id, similarity in similarities:
-        count = celeb_counts.get(celeb_id, 0)
-        
-        if count >= same_celeb_limit:
-            # 초과 시 패널티 적용
-            adjusted_sim = similarity - (penalty * (count - same_celeb_limit + 1))
-        else:
-            adjusted_sim = similarity
-        
-        adjusted.append((celeb_id, adjusted_sim))
-        celeb_counts[celeb_id] = count + 1
+    ids = np.array([celeb_id for celeb_id, _ in similarities])
+    scores = np.array([similarity for _, similarity in similarities], dtype=np.float64)
     
-    # 재정렬
-    adjusted.sort(key=lambda x: x[1], reverse=True)
-    return adjusted
+    # 각 항목의 그룹 내 등장 순번 (0부터, 입력 순서 기준)
+    _, inverse, counts = np.unique(ids, return_inverse=True, return_counts=True)
+    order = np.argsort(inverse, kind="stable")
+    starts = np.cumsum(counts) - counts
+    rank_in_group = np.empty(len(ids), dtype=np.int64)
+    rank_in_group[order] = np.arange(len(ids)) - np.repeat(starts, counts)
+    
+    # 허용 횟수 초과분에 비례한 패널티
+    excess = np.maximum(rank_in_group - same_celeb_limit + 1, 0)
+    adjusted = scores - penalty * excess
+    
+    # 재정렬 (동점은 입력 순서 유지)
+    ranked = np.argsort(-adjusted, kind="stable")
+    return [(str(ids[i]), float(adjusted[i])) for i in ranked.tolist()]
 
 
 class TopKSelector:
     """Top-K 선정 클래스"""
     
+    # 1~3위 순위 이름
+    _RANK_NAMES = ("금", "은", "동")
+    
     def __init__(self, config: Optional[TopKConfig] = None):
         """
         Args:
@@ -223,8 +228,9 @@ class TopKSelector:
         Returns:
             순위 이름 (금, 은, 동)
         """
-        names = {1: "금", 2: "은", 3: "동"}
-        return names.get(position, f"{position}위")
+        if 1 <= position <= 3:
+            return self._RANK_NAMES[position - 1]
+        return f"{position}위"
 
 
 # 기본 셀렉터 인스턴스
@@ -4,6 +4,7 @@
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import hashlib
 import json
 from functools import lru_cache
 from typing import Dict, List, Optional, Set
@@ -43,6 +44,9 @@ class ExpressionIndex:
         self._expr_to_indices: Dict[str, List[int]] = {}
         # 연예인 ID -> 표정 리스트
         self._celeb_to_exprs: Dict[str, List[str]] = {}
+        # 표정별 bool 마스크 (표정 x 임베딩 행) 및 표정 -> 마스크 행 번호
+        self._expr_mask: Optional[np.ndarray] = None
+        self._mask_rows: Dict[str, int] = {}
         
         self._loaded = False
         self._initialized = True
@@ -62,6 +66,9 @@ class ExpressionIndex:
             # JSON이 없으면 이미지 디렉토리 구조에서 추론
             self._build_from_directory()
         
+        if celeb_paths.expression_mask_npy.exists() and celeb_paths.expression_labels_json.exists():
+            self._load_mask()
+        
         self._loaded = True
         try:
             logger.info("Expression index stats", data={"expressions": list(self._expr_to_celebs.keys()), "counts": {k: len(v) for k, v in self._expr_to_celebs.items()}})
@@ -85,6 +92,30 @@ class ExpressionIndex:
                     self._celeb_to_exprs[celeb_id] = []
                 self._celeb_to_exprs[celeb_id].append(expr)
     
+    @trace("expression_index._load_mask")
+    def _load_mask(self) -> None:
+        """표정별 bool 마스크 로드 (expr_mask.npy + expr_labels.json)"""
+        with open(celeb_paths.expression_labels_json, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        
+        # 마스크 열 순서는 생성 당시 ids.npy 기준 - 해시가 다르면 (재동기화 등) 다른 연예인을 거를 수 있으므로 사용 안 함
+        if not isinstance(meta, dict) or not celeb_paths.ids_npy.exists():
+            logger.warning("Expression mask has no ids.npy hash - using expr_index.json")
+            return
+        ids_sha256 = hashlib.sha256(celeb_paths.ids_npy.read_bytes()).hexdigest()
+        if meta.get("ids_sha256") != ids_sha256:
+            logger.warning("Expression mask is stale (ids.npy changed) - using expr_index.json")
+            return
+        labels = meta.get("labels", [])
+        
+        mask = np.load(str(celeb_paths.expression_mask_npy))
+        if mask.ndim != 2 or mask.shape[0] != len(labels):
+            logger.warning(f"Expression mask shape mismatch: {mask.shape} vs {len(labels)} labels")
+            return
+        
+        self._expr_mask = mask.astype(bool, copy=False)
+        self._mask_rows = {label: i for i, label in enumerate(labels)}
+    
     def _build_from_directory(self) -> None:
         """디렉토리 구조에서 인덱스 빌드"""
         images_dir = celeb_paths.images_dir
@@ -142,6 +173,14 @@ class ExpressionIndex:
         Returns:
             (filtered_embeddings, filtered_ids)
         """
+        # 마스크가 있고 임베딩 행 수가 일치하면 bool 인덱싱 한 번으로 필터링
+        row = self._mask_rows.get(expression)
+        if row is not None and self._expr_mask.shape[1] == len(ids):
+            mask = self._expr_mask[row]
+            if not mask.any():
+                return embeddings, ids
+            return embeddings[mask], ids[mask]
+        
         target_celebs = set(self.get_celebs_by_expression(expression))
         if not target_celebs:
             # 해당 표정이 없으면 전체 반환
@@ -152,7 +191,7 @@ class ExpressionIndex:
     
     def has_expression(self, expression: str) -> bool:
         """해당 표정이 있는지 확인"""
-        return expression in self._expr_to_celebs
+        return expression in self._expr_to_celebs or expression in self._mask_rows
     
     def count_by_expression(self, expression: str) -> int:
         """특정 표정의 연예인 수"""
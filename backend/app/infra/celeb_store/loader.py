@@ -131,12 +131,31 @@ class CelebDataLoader:
             pass
 
         try:
-            self._embeddings = np.load(str(embeddings_path))
+            # mmap으로 로드 (복사 없이 페이지 캐시 공유)
+            embeddings = np.load(str(embeddings_path), mmap_mode="r")
         except Exception as e:
             logger.exception(f"Failed to load embeddings npy: {e}")
             self._embeddings = None
             return
         
+        # float16 저장본은 로드 시 한 번만 float32로 변환
+        if embeddings.dtype == np.float16:
+            embeddings = embeddings.astype(np.float32)
+        
+        # 행 단위 L2 정규화 (유사도 계산 시 단일 GEMV로 처리)
+        # 이미 정규화된 float32 C-order라면 그대로 사용 (mmap이면 복사 없음)
+        # 임베딩 없는 연예인의 영벡터 행 (manage_embeddings.py)은 정규화된 것으로 간주
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        if (
+            embeddings.dtype == np.float32
+            and embeddings.flags.c_contiguous
+            and np.all(np.isclose(norms, 1.0, atol=1e-3) | (norms == 0))
+        ):
+            self._embeddings = embeddings
+        else:
+            norms[norms == 0] = 1.0
+            self._embeddings = np.ascontiguousarray(embeddings / norms, dtype=np.float32)
+        
         if ids_path.exists():
             try:
                 logger.info("IDs file stats", data={"path": str(ids_path), "size_bytes": ids_path.stat().st_size})
@@ -163,7 +182,7 @@ class CelebDataLoader:
     
     @property
     def embeddings(self) -> Optional[np.ndarray]:
-        """임베딩 배열"""
+        """임베딩 배열 (행 단위 L2 정규화됨)"""
         return self._embeddings
     
     @property
@@ -33,6 +33,11 @@ class CelebPaths:
         """이미지 메타 CSV (celeb_id, expression, image_path)"""
         return self.meta_dir / "images.csv"
     
+    @property
+    def last_sync_json(self) -> Path:
+        """마지막 Firebase 동기화 시점 (manage_embeddings.py 증분 수집용)"""
+        return self.meta_dir / ".last_sync.json"
+    
     # ================== 임베딩 ==================
     
     @property
@@ -45,6 +50,11 @@ class CelebPaths:
         """전체 임베딩 NumPy 파일"""
         return self.embeddings_dir / "embed.npy"
     
+    @property
+    def embeddings_sha256(self) -> Path:
+        """embed.npy SHA-256 사이드카 (sha256sum 형식)"""
+        return self.embeddings_dir / "embed.npy.sha256"
+    
     @property
     def ids_npy(self) -> Path:
         """임베딩 순서에 대응하는 ID 배열"""
@@ -55,6 +65,16 @@ class CelebPaths:
         """표정별 인덱스 JSON"""
         return self.embeddings_dir / "expr_index.json"
     
+    @property
+    def expression_mask_npy(self) -> Path:
+        """표정별 bool 마스크 (n_expressions x n_embeddings)"""
+        return self.embeddings_dir / "expr_mask.npy"
+    
+    @property
+    def expression_labels_json(self) -> Path:
+        """expr_mask.npy 행 순서에 대응하는 표정 라벨 + 생성 당시 ids.npy SHA-256"""
+        return self.embeddings_dir / "expr_labels.json"
+    
     # ================== 이미지 ==================
     
     @property
@@ -4,13 +4,15 @@ blob→이미지 디코딩 (형식/크기 제한)
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
-import base64
-import io
-from typing import Optional, Tuple
+from typing import Optional
+
+try:
+    import pybase64 as base64  # SIMD 가속 (선택적)
+except ImportError:
+    import base64
 
 import cv2
 import numpy as np
-from PIL import Image
 
 from app.core.config import settings
 from app.core.errors import ErrorCode, ImageQualityError
@@ -29,6 +31,23 @@ SUPPORTED_FORMATS = {"jpeg", "jpg", "png", "webp"}
 MAX_IMAGE_SIZE = settings.ws_max_message_size  # 10MB
 MAX_DIMENSION = 4096  # 최대 해상도
 MIN_DIMENSION = 100   # 최소 해상도
+MAX_DATA_URL_HEADER = 128  # Data URL 헤더 최대 길이 ("data:image/jpeg;base64,")
+
+
+def _sniff_image_format(image_bytes: bytes) -> Optional[str]:
+    """
+    매직 바이트로 이미지 형식 판별 (디코더 호출 전 빠른 거부용)
+    
+    Returns:
+        "jpeg" / "png" / "webp", 알 수 없으면 None
+    """
+    if image_bytes[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if image_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "webp"
+    return None
 
 
 @trace("decode_base64_image")
@@ -50,8 +69,16 @@ def decode_base64_image(data: str) -> np.ndarray:
         # Data URL 형식 처리
         if data.startswith("data:"):
             # data:image/jpeg;base64,/9j/4AAQ... 형식
-            header, encoded = data.split(",", 1)
-            
+            # 헤더는 짧으므로 앞부분에서만 ',' 탐색 (전체 payload split 방지)
+            comma = data.find(",", 5, MAX_DATA_URL_HEADER)
+            if comma < 0:
+                raise ImageQualityError(
+                    ErrorCode.IMAGE_INVALID_FORMAT,
+                    "잘못된 Data URL 형식입니다"
+                )
+            header = data[:comma]
+            encoded = data[comma + 1:]
+
             # 형식 검사
             if "image/" in header:
                 format_part = header.split("image/")[1].split(";")[0].lower()
@@ -62,7 +89,15 @@ def decode_base64_image(data: str) -> np.ndarray:
                     )
         else:
             encoded = data
-        
+
+        # 크기 사전 검사 (디코딩 전에 인코딩 길이로 추정 → 불필요한 디코딩 방지)
+        estimated_size = (len(encoded) * 3) >> 2
+        if estimated_size > MAX_IMAGE_SIZE:
+            raise ImageQualityError(
+                ErrorCode.IMAGE_TOO_LARGE,
+                f"이미지 크기가 너무 큽니다: {estimated_size / 1024 / 1024:.1f}MB"
+            )
+
         # Base64 디코딩
         image_bytes = base64.b64decode(encoded)
         logger.info("Decoded bytes", data={"bytes_len": len(image_bytes)})
@@ -73,6 +108,13 @@ def decode_base64_image(data: str) -> np.ndarray:
                 ErrorCode.IMAGE_TOO_LARGE,
                 f"이미지 크기가 너무 큽니다: {len(image_bytes) / 1024 / 1024:.1f}MB"
             )
+
+        # 형식 검사 (매직 바이트) - 지원하지 않는 형식은 imdecode 전에 거부
+        if _sniff_image_format(image_bytes) is None:
+            raise ImageQualityError(
+                ErrorCode.IMAGE_INVALID_FORMAT,
+                "지원하지 않는 이미지 형식입니다"
+            )
         
         # NumPy 배열로 변환
         nparr = np.frombuffer(image_bytes, np.uint8)
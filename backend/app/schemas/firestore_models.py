@@ -15,7 +15,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionDocument:
     """세션 문서 (sessions 컬렉션)"""
     session_id: str
@@ -33,7 +33,7 @@ class SessionDocument:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisDocument:
     """분석 결과 문서 (analyses 컬렉션)"""
     analysis_id: str
@@ -57,7 +57,7 @@ class AnalysisDocument:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """매칭 결과 (results 서브컬렉션)"""
     celeb_id: str
@@ -77,7 +77,7 @@ class MatchResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResultDocument:
     """전체 결과 문서 (results 컬렉션)"""
     result_id: str
@@ -97,7 +97,7 @@ class ResultDocument:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateStats:
     """집계 통계 (선택적)"""
     total_analyses: int = 0
@@ -31,15 +31,23 @@ class Expression(str, Enum):
     SURPRISE = "surprise"
 
 
-@dataclass
+@dataclass(slots=True)
 class FaceInfo:
     """감지된 얼굴 정보"""
-    bbox: tuple[int, int, int, int]  # (x, y, w, h)
+    x: int
+    y: int
+    w: int
+    h: int
     confidence: float
     landmarks: Optional[dict] = None
 
+    @property
+    def bbox(self) -> tuple[int, int, int, int]:
+        """(x, y, w, h) 튜플 (기존 호출부 호환용)"""
+        return (self.x, self.y, self.w, self.h)
+
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionResult:
     """표정 분석 결과"""
     expression: Expression
@@ -47,7 +55,17 @@ class ExpressionResult:
     blendshapes: Optional[dict] = None
 
 
-@dataclass
+# (필드명, 문제로 판정되는 값, 문제 라벨) - QualityResult.issues 순서 유지
+_QUALITY_ISSUE_SPEC = (
+    ("is_blurry", True, "blurry"),
+    ("is_dark", True, "dark"),
+    ("is_bright", True, "bright"),
+    ("face_size_ok", False, "face_too_small"),
+    ("face_centered", False, "face_not_centered"),
+)
+
+
+@dataclass(slots=True)
 class QualityResult:
     """이미지 품질 검사 결과"""
     is_valid: bool = True
@@ -62,21 +80,10 @@ class QualityResult:
     @property
     def issues(self) -> List[str]:
         """품질 문제 목록"""
-        issues = []
-        if self.is_blurry:
-            issues.append("blurry")
-        if self.is_dark:
-            issues.append("dark")
-        if self.is_bright:
-            issues.append("bright")
-        if not self.face_size_ok:
-            issues.append("face_too_small")
-        if not self.face_centered:
-            issues.append("face_not_centered")
-        return issues
-
-
-@dataclass
+        return [label for attr, flagged, label in _QUALITY_ISSUE_SPEC if getattr(self, attr) == flagged]
+
+
+@dataclass(slots=True)
 class CelebCandidate:
     """연예인 후보"""
     celeb_id: str
@@ -86,7 +93,7 @@ class CelebCandidate:
     image_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimilarityResult:
     """유사도 계산 결과"""
     celeb_id: str
@@ -97,7 +104,7 @@ class SimilarityResult:
     image_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RankingResult:
     """순위 결과"""
     celeb_id: str
@@ -108,7 +115,19 @@ class RankingResult:
     image_url: Optional[str] = None
 
 
-@dataclass
+def _match_to_dict(match: RankingResult, rank: int) -> dict:
+    """RankingResult → 응답용 딕셔너리"""
+    return {
+        "celeb_id": match.celeb_id,
+        "name": match.name,
+        "similarity_score": match.score,
+        "rank": rank,
+        "expression": match.expression,
+        "image_url": match.image_url
+    }
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """전체 분석 결과"""
     session_id: str
@@ -129,21 +148,19 @@ class AnalysisResult:
         except Exception:
             pass
 
+        # Top-3가 일반적인 경우이므로 언패킹으로 특화, 그 외는 일반 루프
+        matches = self.top_matches
+        if len(matches) == 3:
+            m0, m1, m2 = matches
+            match_dicts = [_match_to_dict(m0, 1), _match_to_dict(m1, 2), _match_to_dict(m2, 3)]
+        else:
+            match_dicts = [_match_to_dict(m, rank) for rank, m in enumerate(matches, 1)]
+
         return {
             "session_id": self.session_id,
             "detected_expression": self.detected_expression.value,
             "expression_confidence": self.expression_confidence,
-            "matches": [
-                {
-                    "celeb_id": match.celeb_id,
-                    "name": match.name,
-                    "similarity_score": match.score,
-                    "rank": i + 1,
-                    "expression": match.expression,
-                    "image_url": match.image_url
-                }
-                for i, match in enumerate(self.top_matches)
-            ],
+            "matches": match_dicts,
             "quality_flags": {
                 "is_blurry": self.quality.is_blurry,
                 "is_dark": self.quality.is_dark,
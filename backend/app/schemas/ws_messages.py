@@ -1,17 +1,22 @@
 """
-WebSocket 요청/응답 Pydantic 모델
+WebSocket 요청(Pydantic)/응답(dataclass) 모델
 Contract v1 (Step0 fixed) — 프론트 규격을 그대로 수용
 """
 from __future__ import annotations
 
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import List, Optional, Union, Literal
 
+import orjson
 from pydantic import BaseModel, Field, ConfigDict
 
+from app.core.config import settings
+
 
 class MessageType(str, Enum):
     # client -> server
@@ -24,6 +29,11 @@ class MessageType(str, Enum):
     PONG = "pong"
 
 
+# Enum .value 조회를 피하기 위한 문자열 상수 (메시지마다 비교에 사용)
+TYPE_ANALYZE: str = MessageType.ANALYZE.value
+TYPE_PING: str = MessageType.PING.value
+
+
 class AnalyzeStep(str, Enum):
     """
     (내부용) analyze_pipeline에서만 사용
@@ -39,6 +49,15 @@ class AnalyzeStep(str, Enum):
 
 # ================== Request (client -> server) ==================
 
+_ANALYZE_REQUEST_EXAMPLE = {
+    "type": "analyze",
+    "session_id": "s_9f12ab",
+    "seq": 1,
+    "ts_ms": 1730000000000,
+    "image_format": "jpeg",
+    "image_b64": "....",
+}
+
 class AnalyzeRequest(BaseModel):
     type: Literal["analyze"] = "analyze"
     session_id: str
@@ -47,17 +66,9 @@ class AnalyzeRequest(BaseModel):
     image_format: Literal["jpeg"] = "jpeg"
     image_b64: str = Field(..., description='NO "data:image/jpeg;base64," prefix')
 
+    # OpenAPI 예시는 debug 모드에서만 스키마에 포함
     model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "type": "analyze",
-                "session_id": "s_9f12ab",
-                "seq": 1,
-                "ts_ms": 1730000000000,
-                "image_format": "jpeg",
-                "image_b64": "...."
-            }
-        }
+        json_schema_extra={"example": _ANALYZE_REQUEST_EXAMPLE} if settings.debug else None
     )
 
 
@@ -66,50 +77,129 @@ class PingMessage(BaseModel):
 
 
 # ================== Response (server -> client) ==================
+# 서버가 직접 생성하는 응답은 Pydantic 대신 dataclass 사용 (to_dict() 결과를 orjson으로 직렬화)
+# 기존 Field(ge/le) 범위 제약은 __post_init__에서 동일하게 검사
+
+def _check_range(name: str, value, ge=None, le=None) -> None:
+    """숫자 필드 범위 검사 (Pydantic Field(ge, le)와 동일 조건, 위반 시 ValueError)"""
+    if (ge is not None and value < ge) or (le is not None and value > le):
+        raise ValueError(f"{name} out of range [{ge}, {le}]: {value}")
 
-class ResultItem(BaseModel):
-    rank: int = Field(..., ge=1, le=3)
+
+@dataclass(slots=True, kw_only=True)
+class ResultItem:
+    rank: int
     celeb_id: str
     celeb_name: str
-    similarity: float = Field(..., ge=0.0, le=1.0)
-    similarity_100: int = Field(..., ge=0, le=100)
+    similarity: float
+    similarity_100: int
     celeb_image_url: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        _check_range("rank", self.rank, ge=1, le=3)
+        _check_range("similarity", self.similarity, ge=0.0, le=1.0)
+        _check_range("similarity_100", self.similarity_100, ge=0, le=100)
+
+    def to_dict(self) -> dict:
+        return {
+            "rank": self.rank,
+            "celeb_id": self.celeb_id,
+            "celeb_name": self.celeb_name,
+            "similarity": self.similarity,
+            "similarity_100": self.similarity_100,
+            "celeb_image_url": self.celeb_image_url,
+        }
+
 
-class ResultMessage(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ResultMessage:
     type: Literal["result"] = "result"
     session_id: str
     seq: int
-    latency_ms: int = Field(..., ge=0)
+    latency_ms: int
 
     expression_label: str
     similarity_method: str = "cosine"
-    quality_flags: List[str] = Field(default_factory=list)
+    quality_flags: List[str] = field(default_factory=list)
 
     results: List[ResultItem]
 
+    def __post_init__(self) -> None:
+        _check_range("latency_ms", self.latency_ms, ge=0)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "session_id": self.session_id,
+            "seq": self.seq,
+            "latency_ms": self.latency_ms,
+            "expression_label": self.expression_label,
+            "similarity_method": self.similarity_method,
+            "quality_flags": self.quality_flags,
+            "results": [item.to_dict() for item in self.results],
+        }
+
 
-class ErrorResponse(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ErrorResponse:
     type: Literal["error"] = "error"
     session_id: str
     seq: int
-    latency_ms: int = Field(..., ge=0)
+    latency_ms: int
 
     error_code: str
     message: str
     details: Optional[dict] = None
 
+    def __post_init__(self) -> None:
+        _check_range("latency_ms", self.latency_ms, ge=0)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "session_id": self.session_id,
+            "seq": self.seq,
+            "latency_ms": self.latency_ms,
+            "error_code": self.error_code,
+            "message": self.message,
+            "details": self.details,
+        }
+
+
+def _utc_now() -> datetime:
+    """현재 UTC 시각 (datetime.now(tz)보다 가벼운 epoch 기반 생성)"""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
 
-class PongMessage(BaseModel):
+
+@dataclass(slots=True, kw_only=True)
+class PongMessage:
     type: Literal["pong"] = "pong"
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=_utc_now)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "timestamp": self.timestamp,
+        }
+
+
+@trace("dump_server_message")
+def dump_server_message(msg: Union[ResultMessage, ErrorResponse, PongMessage]) -> str:
+    """서버 -> 클라이언트 메시지를 JSON 텍스트로 직렬화 (orjson)"""
+    return orjson.dumps(msg.to_dict(), option=orjson.OPT_UTC_Z).decode()
+
+
+# 메시지 type → 검증 함수 (모듈 로드 시 1회 구성)
+_CLIENT_PARSERS = {
+    TYPE_ANALYZE: AnalyzeRequest.model_validate,
+    TYPE_PING: PingMessage.model_validate,
+}
 
 
 @trace("parse_client_message")
 def parse_client_message(data: dict) -> Union[AnalyzeRequest, PingMessage]:
     msg_type = data.get("type")
-    if msg_type == "analyze":
-        return AnalyzeRequest(**data)
-    if msg_type == "ping":
-        return PingMessage(**data)
-    raise ValueError(f"Unknown message type: {msg_type}")
+    parser = _CLIENT_PARSERS.get(msg_type)
+    if parser is None:
+        raise ValueError(f"Unknown message type: {msg_type}")
+    return parser(data)
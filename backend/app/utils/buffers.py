@@ -0,0 +1,51 @@
+"""
+버퍼 할당 유틸리티
+SIMD 정렬 메모리 할당
+"""
+from app.core.debug_tools import trace, trace_enabled, brief
+
+from typing import Tuple, Union
+
+import numpy as np
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+if trace_enabled():
+    logger.info("[TRACE] module loaded", data={"module": __name__})
+
+# AVX2 기준 정렬 (바이트)
+DEFAULT_ALIGNMENT = 32
+
+
+def aligned_empty(
+    shape: Union[int, Tuple[int, ...]],
+    dtype=np.uint8,
+    align: int = DEFAULT_ALIGNMENT
+) -> np.ndarray:
+    """
+    시작 주소가 align 바이트 배수인 C-order 빈 배열 할당
+
+    NumPy 기본 할당은 16바이트 정렬만 보장하므로, 조금 큰 버퍼를 잡고
+    정렬된 오프셋부터 잘라서 반환
+
+    Args:
+        shape: 배열 형태
+        dtype: 데이터 타입
+        align: 정렬 단위 (바이트, 2의 거듭제곱)
+
+    Returns:
+        정렬된 빈 배열
+    """
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -raw.ctypes.data % align
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def is_aligned(array: np.ndarray, align: int = DEFAULT_ALIGNMENT) -> bool:
+    """배열 시작 주소가 align 바이트 배수인지 확인"""
+    return array.ctypes.data % align == 0
@@ -3,8 +3,9 @@ ID 생성/검증 유틸리티
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import os
 import re
-import secrets
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
@@ -16,6 +17,22 @@ PREFIX_ANALYSIS = "anal"
 PREFIX_RESULT = "rslt"
 PREFIX_CELEB = "celb"
 
+# 난수 소스 (secrets.token_hex와 동일한 os.urandom, 호출 단계만 축소)
+_urandom = os.urandom
+
+# 세션 ID 날짜 부분 캐시 [UTC 기준 일(day) 번호, "YYYYMMDD"] - 날짜가 바뀔 때만 재계산
+_session_day_cache: list = [-1, ""]
+
+
+def _utc_date_str() -> str:
+    """현재 UTC 날짜 문자열 (YYYYMMDD, 하루 단위 캐시)"""
+    now = time.time()
+    day = int(now) // 86400
+    if day != _session_day_cache[0]:
+        _session_day_cache[1] = time.strftime("%Y%m%d", time.gmtime(now))
+        _session_day_cache[0] = day
+    return _session_day_cache[1]
+
 
 @trace("generate_session_id")
 def generate_session_id() -> str:
@@ -24,8 +41,8 @@ def generate_session_id() -> str:
     형식: sess_{timestamp}_{random}
     예: sess_20240115_a1b2c3d4
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d")
-    random_part = secrets.token_hex(4)
+    timestamp = _utc_date_str()
+    random_part = _urandom(4).hex()
     return f"{PREFIX_SESSION}_{timestamp}_{random_part}"
 
 
@@ -52,7 +69,7 @@ def generate_request_id() -> str:
     """
     요청 추적용 ID 생성 (짧은 형식)
     """
-    return secrets.token_hex(8)
+    return _urandom(8).hex()
 
 
 # ID 패턴 정의
@@ -60,29 +77,34 @@ SESSION_ID_PATTERN = re.compile(r"^sess_\d{8}_[a-f0-9]{8}$")
 ANALYSIS_ID_PATTERN = re.compile(r"^anal_[a-f0-9]{12}$")
 RESULT_ID_PATTERN = re.compile(r"^rslt_[a-f0-9]{12}$")
 
+# ID 고정 길이 (정규식 전 빠른 거부용)
+SESSION_ID_LENGTH = 22   # sess_YYYYMMDD_xxxxxxxx
+ANALYSIS_ID_LENGTH = 17  # anal_xxxxxxxxxxxx
+RESULT_ID_LENGTH = 17    # rslt_xxxxxxxxxxxx
+
 
 @trace("validate_session_id")
 def validate_session_id(session_id: str) -> bool:
     """세션 ID 유효성 검사"""
-    if not session_id:
+    if not session_id or len(session_id) != SESSION_ID_LENGTH:
         return False
-    return bool(SESSION_ID_PATTERN.match(session_id))
+    return SESSION_ID_PATTERN.match(session_id) is not None
 
 
 @trace("validate_analysis_id")
 def validate_analysis_id(analysis_id: str) -> bool:
     """분석 ID 유효성 검사"""
-    if not analysis_id:
+    if not analysis_id or len(analysis_id) != ANALYSIS_ID_LENGTH:
         return False
-    return bool(ANALYSIS_ID_PATTERN.match(analysis_id))
+    return ANALYSIS_ID_PATTERN.match(analysis_id) is not None
 
 
 @trace("validate_result_id")
 def validate_result_id(result_id: str) -> bool:
     """결과 ID 유효성 검사"""
-    if not result_id:
+    if not result_id or len(result_id) != RESULT_ID_LENGTH:
         return False
-    return bool(RESULT_ID_PATTERN.match(result_id))
+    return RESULT_ID_PATTERN.match(result_id) is not None
 
 
 @trace("extract_date_from_session_id")
@@ -6,6 +6,7 @@ from app.core.debug_tools import trace, trace_enabled, brief
 import time
 from contextlib import contextmanager
 from functools import wraps
+from inspect import iscoroutinefunction
 from typing import Any, Callable, Generator, Optional
 
 from app.core.logger import get_logger
@@ -20,6 +21,8 @@ if trace_enabled():
 class Timer:
     """실행 시간 측정 클래스"""
     
+    __slots__ = ("name", "start_time", "end_time", "elapsed_ms")
+    
     def __init__(self, name: str = "operation"):
         self.name = name
         self.start_time: Optional[float] = None
@@ -79,22 +82,29 @@ def timeit(name: Optional[str] = None, log: bool = True) -> Callable:
     def decorator(func: Callable) -> Callable:
         operation_name = name or func.__name__
         
-        @wraps(func)
-        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            with measure_time(operation_name, log=log) as timer:
-                result = func(*args, **kwargs)
-            return result
+        # 비동기 함수인 경우 async wrapper만 생성
+        if iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                t0 = time.perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    if log:
+                        logger.debug(f"{operation_name} completed", latency_ms=(time.perf_counter_ns() - t0) / 1e6)
+            
+            return async_wrapper
         
         @wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            with measure_time(operation_name, log=log) as timer:
-                result = await func(*args, **kwargs)
-            return result
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            # 컨텍스트 매니저/Timer 생성 없이 직접 측정 (호출마다 오버헤드 최소화)
+            t0 = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if log:
+                    logger.debug(f"{operation_name} completed", latency_ms=(time.perf_counter_ns() - t0) / 1e6)
         
-        # 비동기 함수인 경우 async wrapper 반환
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
     
     return decorator
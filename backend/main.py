@@ -4,12 +4,17 @@ FastAPI 생성/라우팅/WebSocket 등록
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import asyncio
+import os
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException
 
 from app.api.ws import router as ws_router
 from app.core.config import settings
@@ -27,6 +32,46 @@ logger = get_logger(__name__)
 if trace_enabled():
     logger.info("[TRACE] module loaded", data={"module": __name__})
 
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답 (stdlib json 대비 직렬화 고속화)
+    
+    fastapi.responses.ORJSONResponse는 최신 FastAPI에서 인스턴스마다
+    deprecation 경고를 내므로 (requirements는 하한만 지정) 로컬 서브클래스 유지
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY)
+
+
+async def _warm_up() -> None:
+    """AI 모델 초기화 + 연예인 데이터 사전 로딩 (서로 의존성 없음 → 병렬 실행)"""
+    model_status, loader, index = await asyncio.gather(
+        asyncio.to_thread(initialize_all_models),
+        asyncio.to_thread(get_celeb_loader),
+        asyncio.to_thread(get_expression_index),
+        return_exceptions=True,
+    )
+
+    if isinstance(model_status, Exception):
+        logger.warning(f"Model initialization failed: {model_status}")
+    elif not model_status["mediapipe"] and not model_status["deepface"]:
+        logger.warning("No AI models available - service may be limited")
+
+    if isinstance(loader, Exception):
+        logger.warning(f"Data loading failed: {loader}")
+    else:
+        logger.info(f"Loaded {len(loader.celebs)} celebrities")
+
+    if isinstance(index, Exception):
+        logger.warning(f"Data loading failed: {index}")
+    else:
+        logger.info(f"Expression index loaded: {index.expressions}")
+
+    logger.info("Beauty Inside API warm-up complete")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""    # 시작 시
@@ -37,25 +82,9 @@ async def lifespan(app: FastAPI):
     # 진단 로그 (debug/trace 모드에서만)
     log_startup_diagnostics()
 
-    # AI 모델 초기화 (자동 다운로드)
-    model_status = initialize_all_models()
-    if not model_status["mediapipe"] and not model_status["deepface"]:
-        logger.warning("No AI models available - service may be limited")
-    
-    # 연예인 데이터 사전 로딩
-    try:
-        loader = get_celeb_loader()
-        if not loader.is_loaded:
-            loader.load()
-        logger.info(f"Loaded {len(loader.celebs)} celebrities")
-        
-        index = get_expression_index()
-        if not index.is_loaded:
-            index.load()
-        logger.info(f"Expression index loaded: {index.expressions}")
-        
-    except Exception as e:
-        logger.warning(f"Data loading failed: {e}")
+    # 모델/데이터 로딩은 백그라운드에서 진행 (헬스체크는 즉시 응답)
+    # WebSocket 분석 요청은 app.state.warmup 완료까지 대기
+    app.state.warmup = asyncio.create_task(_warm_up())
     
     logger.info("Beauty Inside API started successfully")
     
@@ -63,6 +92,8 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     logger.info("Shutting down Beauty Inside API...")
+    if not app.state.warmup.done():
+        app.state.warmup.cancel()
 
 
 # FastAPI 앱 생성
@@ -71,6 +102,7 @@ app = FastAPI(
     version=settings.app_version,
     description="닮은 연예인 찾기 API - 얼굴 분석 및 유사도 매칭",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     # docs_url="/docs" if settings.debug else None,
     # redoc_url="/redoc" if settings.debug else None,
 )
@@ -82,33 +114,33 @@ app.add_middleware(
     allow_origins=settings.cors_origins_list,
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_methods_list,
-    allow_headers=[settings.cors_allow_headers] if settings.cors_allow_headers == "*" else settings.cors_allow_headers.split(","),
+    allow_headers=settings.cors_allow_headers_list,
 )
 
 
-# Request timing middleware (HTTP용)
-@app.middleware("http")
-async def _timing_middleware(request, call_next):
-    if not trace_enabled():
-        return await call_next(request)
+# Request timing middleware (HTTP용) - 트레이스 활성 시에만 등록
+if trace_enabled():
     import time
-    t0 = time.perf_counter()
-    try:
-        response = await call_next(request)
-        return response
-    finally:
-        dt = (time.perf_counter() - t0) * 1000
+
+    @app.middleware("http")
+    async def _timing_middleware(request, call_next):
+        t0 = time.perf_counter()
         try:
-            logger.info("HTTP request", data={"method": request.method, "path": str(request.url.path), "latency_ms": dt})
-        except Exception:
-            pass
+            response = await call_next(request)
+            return response
+        finally:
+            dt = (time.perf_counter() - t0) * 1000
+            try:
+                logger.info("HTTP request", data={"method": request.method, "path": str(request.url.path), "latency_ms": dt})
+            except Exception:
+                pass
 
 
 # 예외 핸들러
 @app.exception_handler(BeautyInsideError)
 async def beauty_inside_exception_handler(request, exc: BeautyInsideError):
     """커스텀 예외 처리"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
         content={
             "error_code": exc.code.value,
@@ -122,7 +154,7 @@ async def beauty_inside_exception_handler(request, exc: BeautyInsideError):
 async def general_exception_handler(request, exc: Exception):
     """일반 예외 처리"""
     logger.exception(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error_code": "E401",
@@ -136,20 +168,35 @@ async def general_exception_handler(request, exc: Exception):
 app.include_router(ws_router, tags=["websocket"])
 
 
-# 정적 파일 서빙 - 연예인 이미지
-from pathlib import Path
-from fastapi.responses import FileResponse
-celeb_images_path = Path(__file__).parent.parent / "data" / "celebs" / "images" / "famous"
-
-# 이미지 제공 API (CORS 포함)
-@app.get("/api/celeb-image/{filename}")
-async def get_celeb_image(filename: str):
-    """연예인 이미지 제공 (CORS 헤더 포함)"""
-    file_path = celeb_images_path / filename
-    if not file_path.exists():
-        return JSONResponse(status_code=404, content={"error": "Image not found"})
-    # CORS 헤더는 미들웨어에서 처리됨
-    return FileResponse(file_path)
+# 정적 파일 서빙 - 연예인 이미지 (/api/celeb-image/{filename}, CORS는 미들웨어에서 처리)
+class _CelebImageFiles(StaticFiles):
+    """연예인 이미지 StaticFiles - 없는 파일은 기존 계약대로 {"error": "Image not found"} 404 응답"""
+
+    async def check_config(self) -> None:
+        # 디렉터리가 나중에 생길 수 있으므로 기동/첫 요청에서 실패시키지 않음 (없으면 404)
+        try:
+            await super().check_config()
+        except RuntimeError as e:
+            logger.warning(f"Celeb image directory not available: {e}")
+
+    async def get_response(self, path: str, scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as e:
+            if e.status_code != 404:
+                raise
+            return JSONResponse(status_code=404, content={"error": "Image not found"})
+
+
+# 절대 경로 문자열로 1회 계산 (StaticFiles가 경로 이탈(../) 차단)
+_CELEB_IMAGES_DIR = os.path.realpath(
+    os.path.join(os.path.dirname(__file__), os.pardir, "data", "celebs", "images", "famous")
+)
+app.mount(
+    "/api/celeb-image",
+    _CelebImageFiles(directory=_CELEB_IMAGES_DIR, check_dir=False),
+    name="celeb_image",
+)
 
 
 # 헬스체크 엔드포인트
@@ -0,0 +1,42 @@
+"""
+연예인 이미지 정적 서빙 (/api/celeb-image) 계약 테스트
+"""
+from app.core.debug_tools import trace, trace_enabled, brief
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from main import _CelebImageFiles
+
+
+def _client(directory) -> TestClient:
+    app = FastAPI()
+    app.mount("/api/celeb-image", _CelebImageFiles(directory=str(directory), check_dir=False))
+    return TestClient(app)
+
+
+class TestCelebImage:
+    """_CelebImageFiles 테스트"""
+
+    def test_serves_existing_file(self, tmp_path):
+        """존재하는 이미지는 그대로 서빙"""
+        (tmp_path / "a.jpg").write_bytes(b"jpeg")
+
+        response = _client(tmp_path).get("/api/celeb-image/a.jpg")
+
+        assert response.status_code == 200
+        assert response.content == b"jpeg"
+
+    def test_missing_file_keeps_error_body(self, tmp_path):
+        """없는 이미지는 기존 계약의 404 본문 유지"""
+        response = _client(tmp_path).get("/api/celeb-image/none.jpg")
+
+        assert response.status_code == 404
+        assert response.json() == {"error": "Image not found"}
+
+    def test_missing_directory_is_404(self, tmp_path):
+        """디렉터리가 없어도 기동 실패 없이 404"""
+        response = _client(tmp_path / "missing").get("/api/celeb-image/a.jpg")
+
+        assert response.status_code == 404
+        assert response.json() == {"error": "Image not found"}
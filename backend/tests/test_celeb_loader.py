@@ -0,0 +1,59 @@
+"""
+연예인 데이터 로더 (embed.npy 로드) 테스트
+"""
+from app.core.debug_tools import trace, trace_enabled, brief
+
+import numpy as np
+import pytest
+
+from app.infra.celeb_store import loader as loader_module
+from app.infra.celeb_store.loader import CelebDataLoader
+from app.infra.celeb_store.paths import CelebPaths
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    """임시 디렉토리를 데이터 루트로 사용"""
+    paths = CelebPaths(str(tmp_path))
+    paths.embeddings_dir.mkdir(parents=True)
+    monkeypatch.setattr(loader_module, "celeb_paths", paths)
+    return paths
+
+
+def _fresh_loader() -> CelebDataLoader:
+    loader = object.__new__(CelebDataLoader)
+    loader._initialized = False
+    loader.__init__()
+    return loader
+
+
+def _save(paths, embeddings: np.ndarray) -> None:
+    np.save(paths.embeddings_npy, embeddings)
+    np.save(paths.ids_npy, np.asarray([f"id_{i}" for i in range(len(embeddings))], dtype=str))
+
+
+class TestLoadEmbeddings:
+    """CelebDataLoader._load_embeddings 테스트"""
+
+    def test_normalized_rows_stay_memory_mapped(self, paths):
+        """정규화된 float32 행 + 영벡터 행 (임베딩 없음)은 복사 없이 mmap 유지"""
+        embeddings = np.eye(3, 4, dtype=np.float32)
+        embeddings[1] = 0.0
+        _save(paths, embeddings)
+
+        loader = _fresh_loader()
+        loader._load_embeddings()
+
+        assert isinstance(loader._embeddings, np.memmap)
+        assert np.array_equal(loader._embeddings, embeddings)
+
+    def test_unnormalized_rows_are_normalized(self, paths):
+        """정규화되지 않은 행은 정규화된 사본 사용 (영벡터는 그대로)"""
+        embeddings = np.asarray([[3.0, 4.0], [0.0, 0.0]], dtype=np.float32)
+        _save(paths, embeddings)
+
+        loader = _fresh_loader()
+        loader._load_embeddings()
+
+        assert not isinstance(loader._embeddings, np.memmap)
+        assert np.allclose(loader._embeddings, [[0.6, 0.8], [0.0, 0.0]])
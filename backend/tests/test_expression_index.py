@@ -0,0 +1,69 @@
+"""
+표정 인덱스 (expr_mask.npy) 로드 테스트
+"""
+from app.core.debug_tools import trace, trace_enabled, brief
+
+import hashlib
+import json
+
+import numpy as np
+import pytest
+
+from app.infra.celeb_store import index as index_module
+from app.infra.celeb_store.index import ExpressionIndex
+from app.infra.celeb_store.paths import CelebPaths
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    """임시 디렉토리에 ids.npy + 마스크 작성"""
+    paths = CelebPaths(str(tmp_path))
+    paths.embeddings_dir.mkdir(parents=True)
+    np.save(paths.ids_npy, np.asarray(["a", "b", "c"], dtype=str))
+    np.save(paths.expression_mask_npy, np.asarray([[True, False, True]]))
+    paths.expression_labels_json.write_text(json.dumps({
+        "labels": ["smile"],
+        "ids_sha256": hashlib.sha256(paths.ids_npy.read_bytes()).hexdigest(),
+    }), encoding="utf-8")
+    monkeypatch.setattr(index_module, "celeb_paths", paths)
+    return paths
+
+
+def _fresh_index() -> ExpressionIndex:
+    index = object.__new__(ExpressionIndex)
+    index._initialized = False
+    index.__init__()
+    return index
+
+
+class TestExpressionMask:
+    """ExpressionIndex._load_mask 테스트"""
+
+    def test_mask_used_when_ids_match(self, paths):
+        """ids.npy 해시가 같으면 마스크로 필터링"""
+        index = _fresh_index()
+        index._load_mask()
+
+        ids = np.asarray(["a", "b", "c"])
+        _, filtered = index.get_filtered_embeddings("smile", np.eye(3), ids)
+
+        assert filtered.tolist() == ["a", "c"]
+
+    def test_stale_mask_ignored(self, paths):
+        """ids.npy가 바뀌면 (같은 개수라도) 마스크 무시"""
+        np.save(paths.ids_npy, np.asarray(["c", "b", "a"], dtype=str))
+
+        index = _fresh_index()
+        index._load_mask()
+
+        assert index._expr_mask is None
+        assert not index.has_expression("smile")
+
+    def test_legacy_labels_list_ignored(self, paths):
+        """해시 없는 예전 형식 (라벨 리스트)은 사용 안 함"""
+        paths.expression_labels_json.write_text(json.dumps(["smile"]), encoding="utf-8")
+
+        index = _fresh_index()
+        index._load_mask()
+
+        assert index._expr_mask is None
@@ -0,0 +1,65 @@
+"""
+임베딩 동기화 스크립트(scripts/manage_embeddings.py) 테스트
+"""
+from app.core.debug_tools import trace, trace_enabled, brief
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "scripts"))
+
+import manage_embeddings
+from app.infra.celeb_store.paths import CelebPaths
+
+
+class TestValidate:
+    """validate() 테스트"""
+
+    def test_committed_artifacts(self, monkeypatch):
+        """저장소에 포함된 산출물 (object dtype ids.npy) 검증 통과"""
+        paths = CelebPaths(str(REPO_ROOT / "data"))
+        if not paths.ids_npy.exists():
+            pytest.skip("committed artifacts not present")
+        monkeypatch.setattr(manage_embeddings, "celeb_paths", paths)
+
+        manager = manage_embeddings.CelebEmbeddingSyncManager(mode="validate")
+        assert manager.validate()
+
+    def test_fixed_width_ids_are_memory_mapped(self, tmp_path):
+        """고정폭 문자열 ids는 pickle 없이 mmap으로 로드"""
+        path = tmp_path / "ids.npy"
+        np.save(path, np.asarray(["a", "bc"], dtype=str))
+
+        ids = manage_embeddings._load_ids(path)
+
+        assert isinstance(ids, np.memmap)
+        assert ids.tolist() == ["a", "bc"]
+
+
+class TestCountLines:
+    """_count_lines 테스트"""
+
+    @pytest.mark.parametrize("content", [
+        b"celeb_id\na\nb\n",
+        b"celeb_id\na\nb",
+    ])
+    def test_matches_line_iteration(self, tmp_path, content):
+        """마지막 개행 유무와 관계없이 기존 sum(1 for _ in f) - 1 과 동일"""
+        path = tmp_path / "celebs.csv"
+        path.write_bytes(content)
+
+        with open(path, "r", encoding="utf-8") as f:
+            expected = sum(1 for _ in f) - 1
+
+        assert manage_embeddings._count_lines(path) == expected == 2
+
+    def test_chunk_boundary(self, tmp_path):
+        """청크 경계에 걸친 파일도 동일하게 셈"""
+        path = tmp_path / "celebs.csv"
+        path.write_bytes(b"h\n" + b"x\n" * 10 + b"y")
+
+        assert manage_embeddings._count_lines(path, chunk_size=3) == 11
@@ -3,12 +3,17 @@
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import base64
+from pathlib import Path
+
+import cv2
 import numpy as np
 import pytest
 
 from app.core.errors import ErrorCode, FaceDetectionError, ImageQualityError
 from app.domain.expression.quality_gate import (
     QualityGate,
+    _to_gray,
     calculate_blur_score,
     calculate_brightness,
     check_face_centered,
@@ -17,7 +22,10 @@ from app.domain.expression.quality_gate import (
     validate_face_count,
     validate_quality,
 )
-from app.schemas.result_models import QualityResult
+from app.schemas.result_models import FaceInfo, QualityResult
+from app.utils.buffers import aligned_empty, is_aligned
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
 
 
 class TestCalculateBlurScore:
@@ -47,6 +55,62 @@ class TestCalculateBlurScore:
         
         score = calculate_blur_score(image)
         assert score > 0
+    
+    def test_large_image_downsampled(self):
+        """max_dim 지정 시 축소 후에도 선명/흐림 구분 유지"""
+        rng = np.random.default_rng(0)
+        sharp = rng.integers(0, 256, (960, 1280, 3), dtype=np.uint8)
+        flat = np.ones((960, 1280, 3), dtype=np.uint8) * 128
+        
+        assert calculate_blur_score(sharp, max_dim=256) > 1000
+        assert calculate_blur_score(flat, max_dim=256) < 10
+        assert calculate_blur_score(sharp) > 1000
+    
+    @pytest.mark.parametrize("ksize", [5, 9, 15])
+    def test_blurred_photo_is_blurry(self, ksize):
+        """실제 사진에 가우시안 블러를 주면 기본 설정에서 흐림 판정"""
+        path = REPO_ROOT / "sample.b64.txt"
+        if not path.exists():
+            pytest.skip("sample image not present")
+        data = base64.b64decode(path.read_text(encoding="utf-8").strip())
+        image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        
+        assert not check_image_quality(image).is_blurry
+        assert check_image_quality(cv2.GaussianBlur(image, (ksize, ksize), 0)).is_blurry
+
+
+class TestAlignedBuffers:
+    """정렬 버퍼 테스트"""
+    
+    @pytest.mark.parametrize("shape,dtype", [
+        ((480, 640), np.uint8),
+        ((37, 53), np.uint8),
+        ((101, 99), np.float32),
+    ])
+    def test_aligned_empty(self, shape, dtype):
+        """요청한 shape/dtype의 32바이트 정렬 C-order 배열"""
+        buf = aligned_empty(shape, dtype)
+        
+        assert buf.shape == shape
+        assert buf.dtype == dtype
+        assert buf.flags.c_contiguous
+        assert is_aligned(buf)
+    
+    def test_gray_conversion_writes_into_aligned_buffer(self):
+        """cvtColor가 정렬 dst를 재할당 없이 사용"""
+        image = np.zeros((37, 53, 3), dtype=np.uint8)
+        
+        assert is_aligned(_to_gray(image))
+    
+    def test_non_contiguous_gray_copied_to_aligned_buffer(self):
+        """비연속 그레이스케일 ROI는 정렬 버퍼로 복사"""
+        image = np.zeros((100, 100), dtype=np.uint8)
+        roi = image[10:50, 3:77]
+        
+        gray = _to_gray(roi)
+        
+        assert is_aligned(gray)
+        assert np.array_equal(gray, roi)
 
 
 class TestCalculateBrightness:
@@ -97,6 +161,13 @@ class TestCheckFaceSize:
         image_shape = (480, 640)
         
         assert check_face_size(bbox, image_shape, min_size=80) is True
+    
+    def test_face_info_bbox(self):
+        """FaceInfo.bbox 튜플을 그대로 넘기는 기존 호출부"""
+        face = FaceInfo(x=50, y=50, w=100, h=100, confidence=0.9)
+        
+        assert face.bbox == (50, 50, 100, 100)
+        assert check_face_size(face.bbox, (480, 640), min_size=80) is True
 
 
 class TestCheckFaceCentered:
@@ -163,6 +234,16 @@ class TestCheckImageQuality:
         
         assert quality.is_dark is True
         assert quality.is_valid is False
+    
+    def test_brightness_measured_on_face_roi(self):
+        """얼굴 영역 기준 밝기 판정 (어두운 배경 무시)"""
+        image = np.ones((480, 640, 3), dtype=np.uint8) * 10
+        image[140:340, 220:420, :] = 128
+        
+        quality = check_image_quality(image, (220, 140, 200, 200))
+        
+        assert quality.is_dark is False
+        assert quality.brightness_score == pytest.approx(128, abs=1)
 
 
 class TestQualityGate:
@@ -6,6 +6,7 @@ from app.core.debug_tools import trace, trace_enabled, brief
 import numpy as np
 import pytest
 
+from app.domain.ranking import similarity as similarity_module
 from app.domain.ranking.similarity import (
     SimilarityCalculator,
     batch_cosine_similarity,
@@ -14,6 +15,7 @@ from app.domain.ranking.similarity import (
     cosine_similarity,
     euclidean_distance,
     filter_by_threshold,
+    top_k_indices,
 )
 from app.domain.ranking.score_scale import (
     ScoreScaler,
@@ -53,6 +55,71 @@ class TestCosineSimilarity:
         vec2 = np.array([-1.0, 0.0, 0.0])
         sim = cosine_similarity(vec1, vec2)
         assert sim == pytest.approx(-1.0, abs=0.001)
+    
+    def test_zero_vector(self):
+        """노름 0 벡터도 NaN 없이 계산"""
+        sim = cosine_similarity(np.zeros(3), np.array([1.0, 2.0, 3.0]))
+        assert np.isfinite(sim)
+
+
+class TestNumbaKernels:
+    """Numba JIT 커널 테스트 (numba 미설치 시 건너뜀)"""
+    
+    @pytest.fixture(autouse=True)
+    def _require_numba(self):
+        pytest.importorskip("numba")
+    
+    @pytest.mark.parametrize("dim", [3, 4, 512, 513])
+    def test_dot_matches_numpy(self, dim):
+        """누산기 분할 내적은 np.dot과 동일 (4의 배수 아닌 길이 포함)"""
+        rng = np.random.default_rng(dim)
+        a, b = rng.normal(size=(2, dim))
+        assert similarity_module._dot(a, b) == pytest.approx(float(np.dot(a, b)), rel=1e-9)
+    
+    def test_sq_dist_matches_numpy(self):
+        """제곱 거리는 NumPy 계산과 동일"""
+        rng = np.random.default_rng(0)
+        a, b = rng.normal(size=(2, 512))
+        assert similarity_module._sq_dist(a, b) == pytest.approx(float(np.sum((a - b) ** 2)), rel=1e-9)
+
+
+class TestSimsimdKernels:
+    """SimSIMD 경로 테스트 - NumPy 경로와 결과 비교 (simsimd 미설치 시 건너뜀)"""
+    
+    @pytest.fixture(autouse=True)
+    def _require_simsimd(self):
+        pytest.importorskip("simsimd")
+    
+    @pytest.fixture
+    def vectors(self):
+        rng = np.random.default_rng(0)
+        return rng.normal(size=(2, 512))
+    
+    def test_cosine_matches_numpy(self, vectors, monkeypatch):
+        """simsimd.cosine 결과는 NumPy 경로와 동일"""
+        a, b = vectors
+        fast = cosine_similarity(a, b)
+        monkeypatch.setattr(similarity_module, "simsimd", None)
+        
+        assert fast == pytest.approx(cosine_similarity(a, b), abs=1e-5)
+    
+    def test_euclidean_matches_numpy(self, vectors, monkeypatch):
+        """simsimd.sqeuclidean 결과는 NumPy 경로와 동일"""
+        a, b = vectors
+        fast = euclidean_distance(a, b)
+        monkeypatch.setattr(similarity_module, "simsimd", None)
+        
+        assert fast == pytest.approx(euclidean_distance(a, b), rel=1e-5)
+    
+    def test_batch_cosine_matches_numpy(self, monkeypatch):
+        """simsimd.cdist 배치 결과는 NumPy 경로와 동일"""
+        rng = np.random.default_rng(1)
+        query = rng.normal(size=512).astype(np.float32)
+        candidates = rng.normal(size=(16, 512)).astype(np.float32)
+        fast = batch_cosine_similarity(query, candidates)
+        monkeypatch.setattr(similarity_module, "simsimd", None)
+        
+        assert fast == pytest.approx(batch_cosine_similarity(query, candidates), abs=1e-5)
 
 
 class TestBatchCosineSimilarity:
@@ -73,6 +140,26 @@ class TestBatchCosineSimilarity:
         assert similarities[0] == pytest.approx(1.0, abs=0.001)
         assert similarities[1] == pytest.approx(0.0, abs=0.001)
         assert 0 < similarities[2] < 1
+    
+    def test_assume_normalized_matches_legacy(self):
+        """정규화된 후보에 대한 GEMV 경로는 기존 결과와 동일"""
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=8)
+        candidates = rng.normal(size=(5, 8))
+        normalized = candidates / np.linalg.norm(candidates, axis=1, keepdims=True)
+        
+        expected = batch_cosine_similarity(query, candidates)
+        actual = batch_cosine_similarity(query, normalized, assume_normalized=True)
+        
+        assert actual == pytest.approx(expected, abs=1e-6)
+    
+    def test_assume_normalized_zero_query(self):
+        """노름 0 쿼리도 NaN 없이 0 유사도"""
+        candidates = np.eye(3, dtype=np.float32)
+        
+        similarities = batch_cosine_similarity(np.zeros(3), candidates, assume_normalized=True)
+        
+        assert np.all(similarities == 0.0)
 
 
 class TestEuclideanDistance:
@@ -111,6 +198,19 @@ class TestComputeSimilarities:
         assert results[0][0] == "B"
         # C가 가장 다르므로 마지막
         assert results[-1][0] == "C"
+    
+    def test_top_k_matches_full_sort(self):
+        """k 지정 시 전체 정렬 결과의 앞부분과 동일"""
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=16)
+        candidates = rng.normal(size=(50, 16))
+        ids = np.array([f"id_{i}" for i in range(50)])
+        
+        full = compute_similarities(query, candidates, ids)
+        top = compute_similarities(query, candidates, ids, k=5)
+        
+        assert top == full[:5]
+        assert list(top_k_indices(np.array([0.1, 0.9, 0.5]), 10)) == [1, 2, 0]
 
 
 class TestFilterByThreshold:
@@ -201,6 +301,17 @@ class TestScoreScaler:
         
         assert len(scores) == 3
         assert scores[0] < scores[1] < scores[2]
+    
+    @pytest.mark.parametrize("method", ["linear", "sigmoid", "power", "percentile"])
+    def test_batch_matches_scalar(self, method):
+        """배치 결과는 스칼라 변환과 동일"""
+        scaler = ScoreScaler(method=method)
+        similarities = [-0.2, 0.0, 0.05, 0.31, 0.5, 0.77, 0.85, 1.0, 1.3]
+        similarities += np.linspace(0.0, 1.0, 1001).tolist()
+        
+        scores = scaler.scale_batch(similarities)
+        
+        assert scores == [scaler.scale(s) for s in similarities]
 
 
 class TestApplyDiversity:
@@ -224,6 +335,15 @@ class TestApplyDiversity:
         # 두 번째 A는 패널티 받음
         assert result[0][0] == "A"
         # B가 두 번째 A보다 높아질 수 있음
+    
+    def test_penalty_reorders(self):
+        """초과 중복에 패널티 적용 후 재정렬"""
+        similarities = [("A", 0.9), ("A", 0.85), ("B", 0.8)]
+        
+        result = apply_diversity(similarities, penalty=0.2, same_celeb_limit=1)
+        
+        assert [celeb_id for celeb_id, _ in result] == ["A", "B", "A"]
+        assert result[2][1] == pytest.approx(0.65)
 
 
 class TestTopKSelector:
@@ -4,6 +4,8 @@ Contract v1 (Step0 fixed) 검증
 """
 from app.core.debug_tools import trace, trace_enabled, brief
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -15,6 +17,7 @@ from app.schemas.ws_messages import (
     PongMessage,
     ResultItem,
     ResultMessage,
+    dump_server_message,
     parse_client_message,
 )
 
@@ -76,6 +79,38 @@ class TestResultSchema:
         assert res.type == "result"
         assert len(res.results) == 3
 
+    def test_dump_server_message(self):
+        res = ResultMessage(
+            session_id="s_test",
+            seq=1,
+            latency_ms=10,
+            expression_label="smile",
+            results=[
+                ResultItem(rank=1, celeb_id="c_001", celeb_name="A", similarity=0.82, similarity_100=82),
+            ],
+        )
+        payload = json.loads(dump_server_message(res))
+        assert payload["type"] == "result"
+        assert payload["quality_flags"] == []
+        assert payload["results"][0]["celeb_image_url"] is None
+
+    @pytest.mark.parametrize("field,value", [
+        ("rank", 0),
+        ("rank", 4),
+        ("similarity", -0.1),
+        ("similarity", 1.01),
+        ("similarity_100", 101),
+    ])
+    def test_result_item_range(self, field, value):
+        kwargs = dict(rank=1, celeb_id="c_001", celeb_name="A", similarity=0.82, similarity_100=82)
+        kwargs[field] = value
+        with pytest.raises(ValueError):
+            ResultItem(**kwargs)
+
+    def test_negative_latency_rejected(self):
+        with pytest.raises(ValueError):
+            ResultMessage(session_id="s", seq=1, latency_ms=-1, expression_label="smile", results=[])
+
 
 class TestErrorSchema:
     def test_error_message(self):
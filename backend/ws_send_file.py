@@ -1,15 +1,32 @@
 from app.core.debug_tools import trace, trace_enabled, brief
 
-import asyncio, base64, json, time
+import asyncio, time
 import websockets
 
+try:
+    import orjson
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+    _dumps = json.dumps
+
+try:
+    import pybase64 as base64  # SIMD 가속 (선택적)
+except ImportError:
+    import base64
+
 URI = "ws://localhost:8000/ws/analyze"
 IMG = r"sample.jpg" 
 
+def _read_b64(path: str) -> str:
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode("ascii")
+
 @trace("ws_send_file.main")
 async def main():
-    with open(IMG, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode("ascii")
+    # 파일 읽기/인코딩은 이벤트 루프 밖에서
+    b64 = await asyncio.to_thread(_read_b64, IMG)
 
     payload = {
         "type": "analyze",
@@ -21,7 +38,8 @@ async def main():
     }
 
     async with websockets.connect(URI, max_size=20 * 1024 * 1024) as ws:
-        await ws.send(json.dumps(payload))
+        # 서버는 receive_text()로 받으므로 bytes가 아닌 str(텍스트 프레임)로 전송
+        await ws.send(_dumps(payload))
         print("SENT b64_len =", len(b64))
         msg = await ws.recv()
         print("RECV =", msg)
@@ -1,4 +1,4 @@
-﻿import argparse, json
+﻿import argparse, hashlib, json
 from pathlib import Path
 import numpy as np
 import pandas as pd
@@ -17,9 +17,11 @@ def main():
 
     rng = np.random.default_rng(42)
     embed = rng.normal(size=(args.N, args.D)).astype("float32")
+    embed /= np.linalg.norm(embed, axis=1, keepdims=True)  # L2 normalize rows
     ids = np.array([f"id_{i:04d}" for i in range(args.N)], dtype=str)
 
-    np.save(out_emb / "embed.npy", embed)
+    # float16 rows (half the disk/load size); the server upcasts to float32 once at load
+    np.save(out_emb / "embed.npy", np.ascontiguousarray(embed, dtype=np.float16))
     np.save(out_emb / "ids.npy", ids)
 
     pd.DataFrame({"celeb_id": ids, "celeb_name": [f"celeb_{i:04d}" for i in range(args.N)]}) \
@@ -28,9 +30,19 @@ def main():
     pd.DataFrame(columns=["celeb_id","image_path","expression"]) \
       .to_csv(out_meta / "images.csv", index=False, encoding="utf-8")
 
-    expr = {k: list(range(args.N)) for k in ["smile","sad","surprise","neutral"]}
+    exprs = ["smile","sad","surprise","neutral"]
+    expr = {k: list(range(args.N)) for k in exprs}
     (out_emb / "expr_index.json").write_text(json.dumps(expr, ensure_ascii=False), encoding="utf-8")
 
+    # bitmask layout: mask[e, i] == True if row i has expression exprs[e]
+    mask = np.ones((len(exprs), args.N), dtype=bool)
+    np.save(out_emb / "expr_mask.npy", mask)
+    # the mask columns follow ids.npy order; the server ignores the mask if ids.npy no longer matches
+    ids_sha256 = hashlib.sha256((out_emb / "ids.npy").read_bytes()).hexdigest()
+    (out_emb / "expr_labels.json").write_text(
+        json.dumps({"labels": exprs, "ids_sha256": ids_sha256}), encoding="utf-8"
+    )
+
     print(f"[OK] bootstrapped artifacts: N={args.N} D={args.D}")
 
 if __name__ == "__main__":
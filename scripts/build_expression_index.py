@@ -1,4 +1,4 @@
-﻿import json
+﻿import hashlib, json
 from pathlib import Path
 import numpy as np
 
@@ -8,7 +8,17 @@ EMB.mkdir(parents=True, exist_ok=True)
 embed = np.load(EMB / "embed.npy")
 N = int(embed.shape[0])
 
-expr = {k: list(range(N)) for k in ["smile", "sad", "surprise", "neutral"]}
+exprs = ["smile", "sad", "surprise", "neutral"]
+expr = {k: list(range(N)) for k in exprs}
 (EMB / "expr_index.json").write_text(json.dumps(expr, ensure_ascii=False), encoding="utf-8")
 
-print("[OK] expr_index.json written. N =", N)
+# bitmask layout: mask[e, i] == True if row i has expression exprs[e]
+mask = np.ones((len(exprs), N), dtype=bool)
+np.save(EMB / "expr_mask.npy", mask)
+# the mask columns follow ids.npy order; the server ignores the mask if ids.npy no longer matches
+ids_sha256 = hashlib.sha256((EMB / "ids.npy").read_bytes()).hexdigest()
+(EMB / "expr_labels.json").write_text(
+    json.dumps({"labels": exprs, "ids_sha256": ids_sha256}), encoding="utf-8"
+)
+
+print("[OK] expr_index.json / expr_mask.npy written. N =", N)
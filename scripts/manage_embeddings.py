@@ -5,40 +5,178 @@ Firebase 연예인 임베딩 동기화 - 통합 관리 스크립트
   1. 초기 로드: Firebase → 로컬 파일 생성
   2. 증분 동기화: 로컬 유지 + Firebase 새로운 데이터만 추가
   3. 검증: 로컬 데이터 무결성 확인
+
+증분 동기화 (merge) 전제:
+  celeb_embeddings 문서를 생성/수정하는 쪽은 updated_at (서버 타임스탬프)을 반드시 기록해야 함.
+  updated_at > 마지막 동기화 시점 쿼리는 이 필드가 없는 문서를 건너뛰므로,
+  필드 없는 문서가 하나라도 보이면 .last_sync.json을 기록하지 않고 ID 비교 방식으로 수집.
 """
 
+import os
 import sys
 import json
+import hashlib
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import csv
 import numpy as np
+import pandas as pd
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from google.cloud.firestore_v1.base_query import FieldFilter
+except ImportError:  # 구버전 클라이언트 - where(field, op, value) 사용
+    FieldFilter = None
 
 # Backend 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from app.infra.firestore.client import firestore_manager, init_firebase
+try:
+    from app.infra.firestore.client import firestore_manager, init_firebase
+except ImportError:  # validate 모드는 Firebase 클라이언트 없이도 동작
+    firestore_manager = init_firebase = None
 from app.infra.celeb_store.paths import celeb_paths
 from app.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Firestore 페이지 크기 (배치 RPC 당 문서 수)
+FETCH_PAGE_SIZE = 500
+
+# embed.npy 저장 시 한 번에 채우고 정규화하는 행 수
+SAVE_CHUNK_ROWS = 4096
+
+# 문서 디코딩 (to_dict + 임베딩 변환) 워커 수
+DECODE_WORKERS = 8
+
+# CSV 컬럼 (인덱스 컬럼 제외)
+CELEB_COLUMNS = ["celeb_name", "name", "gender", "birth_year", "agency"]
+IMAGE_COLUMNS = ["image_path"]
+# Firebase 문서 필드 (값은 원본 그대로, 없으면 기본값)
+FIREBASE_FIELDS = {
+    "name": "",
+    "gender": None,
+    "birth_year": None,
+    "agency": None,
+    "image_path": None,
+    "expression": "neutral",
+}
+
+
+def _empty_frame(index, columns: List[str]) -> pd.DataFrame:
+    """인덱스/컬럼만 있는 빈 문자열 DataFrame"""
+    return pd.DataFrame(columns=columns, index=index, dtype=str)
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    """모든 값을 문자열로 읽기 (빈 칸은 NaN 대신 빈 문자열)"""
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8")
+
+
+def _decode_doc(doc) -> Tuple[str, dict, Optional[np.ndarray]]:
+    """Firestore 문서 → (celeb_id, 필드 dict, float32 임베딩 또는 None)"""
+    data = doc.to_dict()
+    emb = data.get("embedding")
+    if isinstance(emb, (list, np.ndarray)):
+        emb = np.asarray(emb, dtype=np.float32)
+    else:
+        emb = None
+    return doc.id, data, emb
+
+
+def _fill_rows(
+    out: np.ndarray,
+    fb_embeddings: Optional[np.ndarray],
+    src: np.ndarray,
+    prev_embeddings: Optional[np.ndarray],
+    prev_pos: Optional[np.ndarray],
+) -> None:
+    """출력 청크를 Firebase/기존 임베딩 행으로 채우고 행 단위 L2 정규화 (영벡터는 그대로)"""
+    rows = src >= 0
+    if rows.any():
+        out[rows] = fb_embeddings[src[rows]]
+    if prev_pos is not None:
+        rows = prev_pos >= 0
+        if rows.any():
+            out[rows] = prev_embeddings[prev_pos[rows]]
+    norms = np.linalg.norm(out, axis=1, keepdims=True)
+    np.divide(out, norms, out=out, where=norms > 0)
+
+
+def _load_last_sync() -> Optional[datetime]:
+    """마지막 동기화 시점 (updated_at 최대값) 로드, 없으면 None"""
+    path = celeb_paths.last_sync_json
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return datetime.fromisoformat(json.load(f)["updated_at"])
+
+
+def _sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 SHA-256 hex digest (OpenSSL 구현, 청크 단위 읽기)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for buf in iter(lambda: f.read(chunk_size), b""):
+            digest.update(buf)
+    return digest.hexdigest()
+
+
+def _load_ids(path: Path) -> np.ndarray:
+    """ids.npy 로드 - 고정폭 문자열은 mmap, 이전 버전의 object 배열은 pickle 로드"""
+    try:
+        return np.load(str(path), mmap_mode="r")
+    except ValueError:  # object dtype은 mmap 불가
+        return np.load(str(path), allow_pickle=True)
+
+
+def _count_lines(path: Path, chunk_size: int = 1 << 20) -> int:
+    """CSV 데이터 행 수 (헤더 제외) - 바이트 청크 단위로 개행만 셈"""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for buf in iter(lambda: f.read(chunk_size), b""):
+            count += buf.count(b"\n")
+            last = buf[-1:]
+    if last != b"\n":  # 마지막 줄에 개행이 없어도 한 줄로 셈
+        count += 1
+    return count - 1
+
 
 class CelebEmbeddingSyncManager:
     """연예인 임베딩 동기화 관리자"""
     
-    def __init__(self, mode: str = "sync"):
+    def __init__(self, mode: str = "sync", full: bool = False):
         """
         mode:
           - "sync": 전체 동기화 (덮어쓰기)
-          - "merge": 병합 (로컬 유지)
+          - "merge": 병합 (로컬 유지, 마지막 동기화 이후 변경분 또는 신규 ID만 수집)
           - "validate": 검증만 수행
+        full: merge 모드에서도 증분 수집 없이 전체 수집
         """
         self.mode = mode
-        self.firebase_data: Dict = {}
-        self.local_celebs: Dict = {}
-        self.local_images: Dict = {}
+        self.full = full
+        # 증분 수집 기준 시점 (None이면 전체 수집)
+        self.since: Optional[datetime] = (
+            _load_last_sync() if mode == "merge" and not full else None
+        )
+        # 기준 시점 없이 기존 ids.npy와의 ID 차이로 신규 문서만 받았을 때의 기존 ID
+        self.known_ids: Optional[pd.Index] = None
+        # 이번 수집에서 본 updated_at 최대값 (.last_sync.json에 기록)
+        self.max_updated_at: Optional[datetime] = None
+        # updated_at이 없는 문서 수 (있으면 증분 기준 시점을 기록하지 않음)
+        self.missing_updated_at = 0
+        # Firebase 메타 (celeb_id 인덱스, 컬럼 단위) + embedding_row 컬럼 (-1: 임베딩 없음)
+        self.firebase_data = _empty_frame(
+            pd.Index([], name="celeb_id"), [*FIREBASE_FIELDS, "embedding_row"]
+        ).astype({"embedding_row": np.intp})
+        # Firebase 임베딩 (embedding_row로 참조하는 N x D 연속 배열)
+        self.firebase_embeddings: Optional[np.ndarray] = None
+        # celeb_id 인덱스 / (celeb_id, expression) 인덱스
+        self.local_celebs = _empty_frame(pd.Index([], name="celeb_id"), CELEB_COLUMNS)
+        self.local_images = _empty_frame(
+            pd.MultiIndex.from_tuples([], names=["celeb_id", "expression"]), IMAGE_COLUMNS
+        )
     
     def print_header(self, title: str):
         """헤더 출력"""
@@ -72,6 +210,8 @@ class CelebEmbeddingSyncManager:
         self.print_step(1, "Firebase 연결 중...")
         
         try:
+            if init_firebase is None:
+                raise Exception("app.infra.firestore.client 모듈 없음")
             init_firebase()
             db = firestore_manager.client
             if db is None:
@@ -94,38 +234,56 @@ class CelebEmbeddingSyncManager:
                 raise Exception("Firestore 연결 없음")
             
             collection = db.collection("celeb_embeddings")
-            docs = list(collection.stream())
-            
-            if not docs:
-                self.print_error("Firebase에 데이터가 없습니다")
-                return False
+            if self.since is not None:
+                self.print_info(f"증분 수집: updated_at > {self.since.isoformat()}", indent=1)
+                pages = self._iter_updated_pages(collection, self.since)
+            elif self.mode == "merge" and not self.full and (
+                previous := self._load_previous_embeddings()
+            ) is not None:
+                self.known_ids = previous[0]
+                pages = self._iter_new_pages(db, collection, self.known_ids)
+            else:
+                pages = self._iter_pages(collection.order_by("__name__"))
             
             count = 0
-            for doc in docs:
+            celeb_ids: List[str] = []
+            columns: Dict[str, List] = {field: [] for field in FIREBASE_FIELDS}
+            emb_row_of: List[int] = []
+            emb_rows: List[np.ndarray] = []
+            for celeb_id, data, emb in self._iter_decoded(pages):
                 count += 1
-                celeb_id = doc.id
-                data = doc.to_dict()
+                celeb_ids.append(celeb_id)
                 
-                # 메타 정보 추출
-                self.firebase_data[celeb_id] = {
-                    "name": data.get("name", ""),
-                    "gender": data.get("gender"),
-                    "birth_year": data.get("birth_year"),
-                    "agency": data.get("agency"),
-                    "image_path": data.get("image_path"),
-                    "expression": data.get("expression", "neutral"),
-                }
+                if self.known_ids is None:  # ID 비교 경로는 목록 조회 때 이미 반영
+                    self._track_updated_at(data.get("updated_at"))
                 
-                # 임베딩 벡터 추출
-                if "embedding" in data:
-                    emb = data["embedding"]
-                    if isinstance(emb, list):
-                        self.firebase_data[celeb_id]["embedding"] = np.array(emb, dtype=np.float32)
-                    elif isinstance(emb, np.ndarray):
-                        self.firebase_data[celeb_id]["embedding"] = emb.astype(np.float32)
+                # 메타 정보는 컬럼별 리스트로 수집
+                for field, default in FIREBASE_FIELDS.items():
+                    columns[field].append(data.get(field, default))
                 
-                if count % 200 == 0:
-                    self.print_info(f"{count}명 수집 중...", indent=1)
+                # 임베딩 벡터는 모아뒀다가 한 번에 연속 블록으로
+                if emb is not None:
+                    emb_row_of.append(len(emb_rows))
+                    emb_rows.append(emb)
+                else:
+                    emb_row_of.append(-1)
+            
+            if count == 0:
+                if self.incremental:
+                    self.print_success("마지막 동기화 이후 변경 없음")
+                    return True
+                self.print_error("Firebase에 데이터가 없습니다")
+                return False
+            
+            # object dtype 유지 (정수 birth_year가 NaN 때문에 float로 바뀌지 않도록)
+            self.firebase_data = pd.DataFrame(
+                columns, index=pd.Index(celeb_ids, name="celeb_id"), dtype=object
+            )
+            self.firebase_data["embedding_row"] = np.asarray(emb_row_of, dtype=np.intp)
+            
+            # 단일 연속 (N, D) float32 블록으로 변환
+            if emb_rows:
+                self.firebase_embeddings = np.stack(emb_rows)
             
             self.print_success(f"총 {count}명의 연예인 데이터 수집 완료")
             return True
@@ -134,6 +292,110 @@ class CelebEmbeddingSyncManager:
             self.print_error(f"Firebase 쿼리 실패: {e}")
             return False
     
+    def _iter_decoded(self, pages):
+        """
+        페이지 단위 병렬 디코딩 (결과는 문서 순서 유지)
+        
+        현재 페이지를 워커에 넘긴 뒤 이전 페이지 결과를 내보내므로
+        다음 페이지 RPC 동안 디코딩이 진행되고, 메모리에는 최대 두 페이지만 유지
+        """
+        with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as executor:
+            pending = None
+            for page in pages:
+                batch = executor.map(_decode_doc, page)
+                if pending is not None:
+                    yield from pending
+                pending = batch
+            if pending is not None:
+                yield from pending
+    
+    def _print_progress(self, fetched: int, action: str = "수집"):
+        """진행 상황 출력 (문서 단위가 아닌 페이지/배치 RPC 단위로 호출)"""
+        self.print_info(f"{fetched}명 {action} 중...", indent=1)
+    
+    def _iter_pages(self, query, action: str = "수집"):
+        """
+        정렬된 쿼리를 커서 페이지네이션으로 순회 (페이지 리스트 단위)
+        
+        한 번의 긴 stream() 대신 FETCH_PAGE_SIZE 단위 배치 RPC로 가져와
+        스트림 타임아웃을 피하고 메모리에는 한 페이지만 유지
+        """
+        query = query.limit(FETCH_PAGE_SIZE)
+        cursor = None
+        fetched = 0
+        while True:
+            page = (query.start_after(cursor) if cursor is not None else query).get()
+            if not page:
+                return
+            fetched += len(page)
+            self._print_progress(fetched, action)
+            yield page
+            if len(page) < FETCH_PAGE_SIZE:
+                return
+            cursor = page[-1]
+    
+    def _iter_updated_pages(self, collection, since: datetime):
+        """updated_at > since 인 문서만 조회 (변경분 ΔN 건만 전송/디코딩)"""
+        if FieldFilter is not None:
+            query = collection.where(filter=FieldFilter("updated_at", ">", since))
+        else:
+            query = collection.where("updated_at", ">", since)
+        # 부등호 필터 필드가 첫 정렬 키여야 하고, 문서 ID로 커서 위치를 고정
+        return self._iter_pages(query.order_by("updated_at").order_by("__name__"))
+    
+    def _iter_new_pages(self, db, collection, known_ids: pd.Index):
+        """
+        로컬에 없는 ID의 문서만 조회
+        
+        ID 목록은 updated_at만 담은 프로젝션으로 가볍게 받고 (동기화 시점 기록용),
+        신규 문서는 FETCH_PAGE_SIZE개씩 DocumentReference 묶음으로 get_all 멀티 조회
+        """
+        remote_ids = []
+        listing = collection.select(["updated_at"]).order_by("__name__")
+        for page in self._iter_pages(listing, action="ID 조회"):
+            for doc in page:
+                remote_ids.append(doc.id)
+                self._track_updated_at((doc.to_dict() or {}).get("updated_at"))
+        remote_ids = pd.Index(remote_ids)
+        new_ids = remote_ids.difference(known_ids)
+        self.print_info(f"ID 비교: 원격 {len(remote_ids)}명 중 신규 {len(new_ids)}명", indent=1)
+        
+        fetched = 0
+        for start in range(0, len(new_ids), FETCH_PAGE_SIZE):
+            refs = [collection.document(celeb_id) for celeb_id in new_ids[start:start + FETCH_PAGE_SIZE]]
+            page = [doc for doc in db.get_all(refs) if doc.exists]
+            fetched += len(page)
+            self._print_progress(fetched)
+            yield page
+    
+    @property
+    def incremental(self) -> bool:
+        """변경분/신규분만 수집했는지 (받지 않은 연예인은 기존 파일 값 유지)"""
+        return self.since is not None or self.known_ids is not None
+    
+    def _track_updated_at(self, updated_at: Optional[datetime]):
+        """이번 수집에서 본 updated_at 최대값 갱신"""
+        if updated_at is None:
+            self.missing_updated_at += 1
+        elif (
+            self.max_updated_at is None or updated_at > self.max_updated_at
+        ):
+            self.max_updated_at = updated_at
+    
+    def _save_last_sync(self):
+        """이번 수집의 updated_at 최대값 기록 (다음 merge 실행의 증분 기준)"""
+        if self.missing_updated_at:
+            # updated_at 쿼리로는 이 문서들을 다시 찾을 수 없으므로 ID 비교 방식 유지
+            self.print_info(
+                f"⚠ updated_at 없는 문서 {self.missing_updated_at}건 - 동기화 시점 기록 생략", indent=1
+            )
+            return
+        if self.max_updated_at is None:
+            return
+        with open(celeb_paths.last_sync_json, "w", encoding="utf-8") as f:
+            json.dump({"updated_at": self.max_updated_at.isoformat()}, f)
+        self.print_info(f"마지막 동기화 시점: {self.max_updated_at.isoformat()}", indent=1)
+    
     # ===== 로컬 데이터 로드 =====
     
     def load_local_files(self) -> bool:
@@ -145,11 +407,8 @@ class CelebEmbeddingSyncManager:
         # celebs.csv 로드
         if celeb_paths.celebs_csv.exists():
             try:
-                with open(celeb_paths.celebs_csv, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        celeb_id = row.get("celeb_id", "")
-                        self.local_celebs[celeb_id] = row
+                df = _read_csv(celeb_paths.celebs_csv)
+                self.local_celebs = df.drop_duplicates("celeb_id", keep="last").set_index("celeb_id")
                 self.print_info(f"celebs.csv: {len(self.local_celebs)}명", indent=1)
                 loaded = True
             except Exception as e:
@@ -160,13 +419,13 @@ class CelebEmbeddingSyncManager:
         # images.csv 로드
         if celeb_paths.images_csv.exists():
             try:
-                with open(celeb_paths.images_csv, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        celeb_id = row.get("celeb_id", "")
-                        expr = row.get("expression", "neutral")
-                        key = (celeb_id, expr)
-                        self.local_images[key] = row
+                df = _read_csv(celeb_paths.images_csv)
+                if "expression" not in df.columns:
+                    df["expression"] = "neutral"
+                self.local_images = (
+                    df.drop_duplicates(["celeb_id", "expression"], keep="last")
+                    .set_index(["celeb_id", "expression"])
+                )
                 self.print_info(f"images.csv: {len(self.local_images)}개", indent=1)
                 loaded = True
             except Exception as e:
@@ -185,46 +444,34 @@ class CelebEmbeddingSyncManager:
         """Firebase 데이터와 로컬 데이터 병합"""
         self.print_step(4, "데이터 병합 중...")
         
-        merged_celebs = dict(self.local_celebs)
-        merged_images = dict(self.local_images)
+        local_celebs = self.local_celebs.reindex(
+            columns=self.local_celebs.columns.union(CELEB_COLUMNS, sort=False)
+        )
         
-        new_celebs = 0
-        new_images = 0
+        # Firebase 메타 → CSV 문자열 컬럼 (None → 빈 문자열)
+        fb = self.firebase_data
+        fb_celebs = fb[["name", "gender", "birth_year", "agency"]].fillna("").astype(str)
+        fb_celebs["celeb_name"] = fb_celebs["name"]
+        
+        existing = fb_celebs.index.isin(local_celebs.index)
+        new_celebs = int((~existing).sum())
         updated_celebs = 0
+        if self.mode == "sync" and existing.any():
+            # 동기화 모드: 기존 데이터 업데이트 (merge 모드는 기존 유지)
+            local_celebs.update(fb_celebs.loc[existing, ["gender", "birth_year", "agency"]])
+            updated_celebs = int(existing.sum())
+        merged_celebs = pd.concat([local_celebs, fb_celebs.loc[~existing]])
         
-        for celeb_id, fb_data in self.firebase_data.items():
-            # Mode에 따라 처리
-            if celeb_id not in merged_celebs:
-                # 새로운 연예인
-                merged_celebs[celeb_id] = {
-                    "celeb_id": celeb_id,
-                    "celeb_name": fb_data.get("name", celeb_id),
-                    "name": fb_data.get("name", celeb_id),
-                    "gender": fb_data.get("gender", ""),
-                    "birth_year": fb_data.get("birth_year", ""),
-                    "agency": fb_data.get("agency", "")
-                }
-                new_celebs += 1
-            elif self.mode == "sync":
-                # 동기화 모드: 기존 데이터 업데이트
-                merged_celebs[celeb_id].update({
-                    "gender": fb_data.get("gender", ""),
-                    "birth_year": fb_data.get("birth_year", ""),
-                    "agency": fb_data.get("agency", "")
-                })
-                updated_celebs += 1
-            # merge 모드: 기존 데이터 유지
-            
-            # 이미지 데이터 추가
-            expr = fb_data.get("expression", "neutral")
-            key = (celeb_id, expr)
-            if key not in merged_images:
-                merged_images[key] = {
-                    "celeb_id": celeb_id,
-                    "image_path": fb_data.get("image_path", f"famous/{celeb_id}_{expr}.jpg"),
-                    "expression": expr
-                }
-                new_images += 1
+        # 이미지 데이터 추가 (없는 (celeb_id, expression)만)
+        fb_images = pd.DataFrame(
+            {"image_path": fb["image_path"].to_numpy()},
+            index=pd.MultiIndex.from_arrays(
+                [fb.index, fb["expression"]], names=["celeb_id", "expression"]
+            ),
+        )
+        fb_images = fb_images.loc[~fb_images.index.isin(self.local_images.index)]
+        new_images = len(fb_images)
+        merged_images = pd.concat([self.local_images, fb_images])
         
         self.print_info(f"신규 연예인: {new_celebs}명", indent=1)
         if updated_celebs > 0:
@@ -243,6 +490,9 @@ class CelebEmbeddingSyncManager:
         self.print_step(5, "파일 저장 중...")
         
         try:
+            # celeb_id 정렬은 한 번만 (celebs.csv / embed.npy 행 순서 공유)
+            self.local_celebs = self.local_celebs.sort_index()
+            
             # celebs.csv 저장
             self._save_celebs_csv()
             self.print_success("celebs.csv 저장 완료")
@@ -262,65 +512,101 @@ class CelebEmbeddingSyncManager:
     
     def _save_celebs_csv(self):
         """celebs.csv 저장"""
-        fieldnames = ["celeb_id", "celeb_name", "name", "gender", "birth_year", "agency"]
-        
-        with open(celeb_paths.celebs_csv, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
-            writer.writeheader()
-            
-            for celeb_id in sorted(self.local_celebs.keys()):
-                row = self.local_celebs[celeb_id]
-                writer.writerow({
-                    "celeb_id": row.get("celeb_id", celeb_id),
-                    "celeb_name": row.get("celeb_name", row.get("name", celeb_id)),
-                    "name": row.get("name", celeb_id),
-                    "gender": row.get("gender", ""),
-                    "birth_year": row.get("birth_year", ""),
-                    "agency": row.get("agency", "")
-                })
+        df = self.local_celebs.reindex(columns=CELEB_COLUMNS)
+        ids = df.index.to_series()
+        df["name"] = df["name"].fillna(ids)
+        df["celeb_name"] = df["celeb_name"].fillna(df["name"])
+        df.fillna("").to_csv(
+            celeb_paths.celebs_csv, index=True, index_label="celeb_id", encoding="utf-8"
+        )
     
     def _save_images_csv(self):
         """images.csv 저장"""
-        fieldnames = ["celeb_id", "image_path", "expression"]
-        
-        with open(celeb_paths.images_csv, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, restval="")
-            writer.writeheader()
-            
-            for (celeb_id, expr) in sorted(self.local_images.keys()):
-                row = self.local_images[(celeb_id, expr)]
-                writer.writerow({
-                    "celeb_id": row.get("celeb_id", celeb_id),
-                    "image_path": row.get("image_path", ""),
-                    "expression": row.get("expression", expr)
-                })
+        df = self.local_images.reindex(columns=IMAGE_COLUMNS).fillna("").sort_index()
+        df.reset_index()[["celeb_id", "image_path", "expression"]].to_csv(
+            celeb_paths.images_csv, index=False, encoding="utf-8"
+        )
     
     def _save_embeddings(self):
-        """임베딩 벡터를 numpy 파일로 저장"""
-        celeb_ids = sorted(self.local_celebs.keys())
-        embeddings_list = []
-        missing_count = 0
-        
-        for celeb_id in celeb_ids:
-            if celeb_id in self.firebase_data and self.firebase_data[celeb_id].get("embedding") is not None:
-                embeddings_list.append(self.firebase_data[celeb_id]["embedding"])
-            else:
-                # 임베딩 없으면 영벡터
-                embeddings_list.append(np.zeros(512, dtype=np.float32))
-                missing_count += 1
+        """
+        임베딩 벡터를 numpy 파일로 저장
         
-        embeddings = np.array(embeddings_list, dtype=np.float32)
-        ids = np.array(celeb_ids, dtype=object)
+        embed.npy는 임시 파일을 memmap으로 열어 SAVE_CHUNK_ROWS 행씩 채우고
+        정규화한 뒤 교체 (임시 배열은 청크 크기로 제한, Firebase에서 받은
+        firebase_embeddings 블록은 그대로 메모리에 있음)
+        """
+        celeb_ids = self.local_celebs.index.tolist()  # save_files에서 정렬됨
+        # 증분 수집이면 이번에 받지 않은 연예인은 기존 embed.npy 값 유지
+        previous = self._load_previous_embeddings() if self.incremental else None
+        if self.firebase_embeddings is not None:
+            dim = self.firebase_embeddings.shape[1]
+        elif previous is not None:
+            dim = previous[1].shape[1]
+        else:
+            dim = 512
         
-        np.save(str(celeb_paths.embeddings_npy), embeddings)
+        # 행별 원본 위치: Firebase 블록 행 / 기존 embed.npy 행 (-1: 없음)
+        src = (
+            self.firebase_data["embedding_row"]
+            .reindex(celeb_ids, fill_value=-1)
+            .to_numpy(dtype=np.intp)
+        )
+        prev_pos = None
+        prev_embeddings = None
+        if previous is not None:
+            prev_ids, prev_embeddings = previous
+            prev_pos = prev_ids.get_indexer(celeb_ids)
+            prev_pos[src >= 0] = -1
+        has_emb = src >= 0 if prev_pos is None else (src >= 0) | (prev_pos >= 0)
+        missing_count = int((~has_emb).sum())
+        
+        # 새 파일은 0으로 채워지므로 임베딩 없는 연예인은 영벡터
+        n = len(celeb_ids)
+        tmp_path = celeb_paths.embeddings_npy.with_suffix(".npy.tmp")
+        if n:
+            embeddings = np.lib.format.open_memmap(
+                str(tmp_path), mode="w+", dtype=np.float32, shape=(n, dim)
+            )
+            for start in range(0, n, SAVE_CHUNK_ROWS):
+                stop = min(start + SAVE_CHUNK_ROWS, n)
+                _fill_rows(
+                    embeddings[start:stop],
+                    self.firebase_embeddings, src[start:stop],
+                    prev_embeddings, None if prev_pos is None else prev_pos[start:stop],
+                )
+            embeddings.flush()
+            # 매핑을 모두 해제해야 교체 가능 (Windows는 매핑된 파일 교체 불가)
+            del embeddings, previous, prev_embeddings
+            os.replace(tmp_path, celeb_paths.embeddings_npy)
+        else:
+            del previous, prev_embeddings
+            np.save(str(celeb_paths.embeddings_npy), np.zeros((0, dim), dtype=np.float32))
+        # 무결성 사이드카 (validate()에서 재계산해 비교)
+        celeb_paths.embeddings_sha256.write_text(
+            f"{_sha256(celeb_paths.embeddings_npy)}  {celeb_paths.embeddings_npy.name}\n",
+            encoding="utf-8",
+        )
+        
+        # 고정폭 유니코드 (<U{최대 길이}) - pickle 없이 연속 버퍼로 저장, mmap 가능
+        ids = np.asarray(celeb_ids, dtype=str)
         np.save(str(celeb_paths.ids_npy), ids)
         
-        self.print_info(f"embed.npy: {embeddings.shape} {embeddings.dtype}", indent=1)
+        self.print_info(f"embed.npy: ({n}, {dim}) float32", indent=1)
         self.print_info(f"ids.npy: {ids.shape}", indent=1)
         
         if missing_count > 0:
             self.print_info(f"⚠ {missing_count}명의 임베딩 누락 (영벡터 사용)", indent=1)
     
+    def _load_previous_embeddings(self) -> Optional[Tuple[pd.Index, np.ndarray]]:
+        """기존 ids.npy / embed.npy 로드 (없거나 길이 불일치면 None)"""
+        if not (celeb_paths.embeddings_npy.exists() and celeb_paths.ids_npy.exists()):
+            return None
+        ids = _load_ids(celeb_paths.ids_npy)
+        embeddings = np.load(str(celeb_paths.embeddings_npy), mmap_mode="r")
+        if embeddings.ndim != 2 or len(ids) != len(embeddings):
+            return None
+        return pd.Index(ids.astype(str)), embeddings
+    
     # ===== 검증 =====
     
     def validate(self) -> bool:
@@ -333,27 +619,33 @@ class CelebEmbeddingSyncManager:
         try:
             # celebs.csv 검증
             if celeb_paths.celebs_csv.exists():
-                with open(celeb_paths.celebs_csv, 'r', encoding='utf-8') as f:
-                    celebs_count = sum(1 for _ in f) - 1  # 헤더 제외
+                celebs_count = _count_lines(celeb_paths.celebs_csv)
                 self.print_info(f"celebs.csv: {celebs_count}명", indent=1)
             
             # images.csv 검증
             if celeb_paths.images_csv.exists():
-                with open(celeb_paths.images_csv, 'r', encoding='utf-8') as f:
-                    images_count = sum(1 for _ in f) - 1  # 헤더 제외
+                images_count = _count_lines(celeb_paths.images_csv)
                 self.print_info(f"images.csv: {images_count}개", indent=1)
             
             # embed.npy 검증
             if celeb_paths.embeddings_npy.exists():
-                embeddings = np.load(str(celeb_paths.embeddings_npy))
+                # mmap: 헤더/shape만 읽고 전체 블록은 메모리에 올리지 않음
+                embeddings = np.load(str(celeb_paths.embeddings_npy), mmap_mode="r")
                 self.print_info(f"embed.npy: {embeddings.shape} {embeddings.dtype}", indent=1)
                 
                 if embeddings.shape[1] != 512:
                     errors.append(f"임베딩 차원 오류: {embeddings.shape[1]} (예상: 512)")
+                
+                if celeb_paths.embeddings_sha256.exists():
+                    expected = celeb_paths.embeddings_sha256.read_text(encoding="utf-8").split()[0]
+                    if _sha256(celeb_paths.embeddings_npy) != expected:
+                        errors.append("embed.npy SHA-256 불일치 (파일 손상 또는 외부 수정)")
+                else:
+                    warnings.append("embed.npy.sha256 없음 (무결성 검사 생략)")
             
             # ids.npy 검증
             if celeb_paths.ids_npy.exists():
-                ids = np.load(str(celeb_paths.ids_npy), allow_pickle=True)
+                ids = _load_ids(celeb_paths.ids_npy)
                 self.print_info(f"ids.npy: {ids.shape}", indent=1)
             
             if errors:
@@ -386,6 +678,11 @@ class CelebEmbeddingSyncManager:
         if not self.fetch_from_firebase():
             return False
         
+        # 증분 수집 결과 변경 없으면 로컬 파일 그대로 두고 검증만 (ID 비교로 본 시점은 기록)
+        if self.incremental and self.firebase_data.empty:
+            self._save_last_sync()
+            return self.validate()
+        
         # 3. 로컬 데이터 로드 (merge 모드일 때만)
         if self.mode in ["merge", "sync"]:
             if not self.load_local_files():
@@ -398,6 +695,7 @@ class CelebEmbeddingSyncManager:
         # 5. 파일 저장
         if not self.save_files():
             return False
+        self._save_last_sync()
         
         # 6. 검증
         if not self.validate():
@@ -422,7 +720,8 @@ def main():
         epilog="""
 사용 예시:
   python manage_embeddings.py --mode sync        # 전체 동기화
-  python manage_embeddings.py --mode merge       # 병합 (기존 유지)
+  python manage_embeddings.py --mode merge       # 병합 (기존 유지, 변경분/신규분만 수집)
+  python manage_embeddings.py --mode merge --full  # 병합 (전체 수집)
   python manage_embeddings.py --mode validate    # 검증만
         """
     )
@@ -433,10 +732,15 @@ def main():
         default="sync",
         help="동기화 모드 (기본값: sync)"
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="merge 모드에서도 .last_sync.json 무시하고 전체 수집"
+    )
     
     args = parser.parse_args()
     
-    manager = CelebEmbeddingSyncManager(mode=args.mode)
+    manager = CelebEmbeddingSyncManager(mode=args.mode, full=args.full)
     success = manager.run()
     
     sys.exit(0 if success else 1)
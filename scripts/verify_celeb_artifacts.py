@@ -1,6 +1,6 @@
-import json, os
+import csv, hashlib, os
 import numpy as np
-import pandas as pd
+import orjson
 
 ROOT = "data/celebs"
 EMB = f"{ROOT}/embeddings"
@@ -20,33 +20,55 @@ for k, p in paths.items():
     if os.path.getsize(p) <= 0:
         raise SystemExit(f"[FAIL] 0-byte: {k} -> {p}")
 
-embed = np.load(paths["embed"])
-ids = np.load(paths["ids"], allow_pickle=False)
+embed = np.load(paths["embed"], mmap_mode="r")  # mmap: shape/dtype 검사만 하므로 전체 로드 불필요
+try:
+    ids = np.load(paths["ids"], mmap_mode="r")  # 고정폭 문자열 ids (pickle 불필요)
+except ValueError:  # 이전 버전의 object 배열은 mmap 불가
+    ids = np.load(paths["ids"], allow_pickle=True)
+
+sha_path = paths["embed"] + ".sha256"
+if os.path.exists(sha_path):
+    expected = open(sha_path, "r", encoding="utf-8").read().split()[0]
+    digest = hashlib.sha256()
+    with open(paths["embed"], "rb") as f:
+        for buf in iter(lambda: f.read(1 << 20), b""):
+            digest.update(buf)
+    if digest.hexdigest() != expected:
+        raise SystemExit(f"[FAIL] sha256 mismatch: {paths['embed']}")
 
 if embed.shape[0] != len(ids):
     raise SystemExit(f"[FAIL] len(ids) != embed.shape[0] : {len(ids)} vs {embed.shape[0]}")
 
-celebs = pd.read_csv(paths["celebs"])
+# stdlib csv: 컬럼 3개 검사에 pandas 콜드 import(~0.5s)는 과함
+with open(paths["celebs"], "r", encoding="utf-8-sig", newline="") as f:
+    reader = csv.reader(f)
+    header = next(reader, [])
+    # 빈 줄은 건너뛰고 (pd.read_csv와 동일) 짧은 행은 빈 칸으로 채움
+    rows = [row + [""] * (len(header) - len(row)) for row in reader if row]
 
-if "celeb_id" not in celebs.columns:
+if "celeb_id" not in header:
     raise SystemExit("[FAIL] celebs.csv must contain 'celeb_id' column")
 
-if "name" not in celebs.columns:
+if "name" not in header:
     raise SystemExit("[FAIL] celebs.csv must contain 'name' column")
-if (celebs["name"].astype(str).str.strip() == "").any():
+id_col, name_col = header.index("celeb_id"), header.index("name")
+if any(not row[name_col].strip() for row in rows):
     raise SystemExit("[FAIL] celebs.csv has empty 'name' values")
 
-celeb_id_set = set(celebs["celeb_id"].astype(str).tolist())
-missing = [x for x in ids.astype(str).tolist() if x not in celeb_id_set]
+ids_str = ids.astype(str)
+missing = ids_str[np.isin(ids_str, [row[id_col] for row in rows], invert=True)].tolist()
 if missing:
     raise SystemExit(f"[FAIL] ids not in celebs.csv: sample={missing[:10]} (total {len(missing)})")
 
-expr = json.load(open(paths["expr"], "r", encoding="utf-8"))
+with open(paths["expr"], "rb") as f:
+    expr = orjson.loads(f.read())
 N = embed.shape[0]
 for label, idxs in expr.items():
-    for i in idxs:
-        if not (0 <= int(i) < N):
-            raise SystemExit(f"[FAIL] expr_index out of range: label={label}, idx={i}, N={N}")
+    arr = np.asarray(idxs, dtype=np.int64)
+    bad = (arr < 0) | (arr >= N)
+    if bad.any():
+        i = arr[bad][0]
+        raise SystemExit(f"[FAIL] expr_index out of range: label={label}, idx={i}, N={N}")
 
 print("[OK] artifacts validated")
 print("N =", N, "D =", embed.shape[1])